@@ -32,7 +32,7 @@ fi
 
 echo "  Installing Python dependencies..."
 "${SCRIPT_DIR}/.venv/bin/pip" install --quiet \
-    prompt_toolkit pygments aiohttp zeroconf
+    prompt_toolkit pygments aiohttp zeroconf orjson rapidfuzz
 
 echo ""
 echo "All done. Run Manuscripts with: ./run.sh"
@@ -16,7 +16,7 @@ echo "Building manuscripts-receiver v${VERSION} for macOS..."
 # Use a build venv to avoid Homebrew's externally-managed-environment restriction
 python3 -m venv "${SCRIPT_DIR}/.build-venv"
 source "${SCRIPT_DIR}/.build-venv/bin/activate"
-pip install --quiet pyinstaller aiohttp zeroconf pystray Pillow pyobjc
+pip install --quiet pyinstaller aiohttp zeroconf pystray Pillow pyobjc uvloop orjson
 
 python3 make_icons.py
 
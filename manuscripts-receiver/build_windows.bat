@@ -11,7 +11,7 @@ if "%VERSION%"=="" set VERSION=1.0
 
 echo Building manuscripts-receiver v%VERSION% for Windows...
 
-pip install --quiet pyinstaller aiohttp zeroconf pystray Pillow pywin32
+pip install --quiet pyinstaller aiohttp zeroconf pystray Pillow pywin32 orjson
 
 python make_icons.py
 
@@ -43,23 +43,15 @@ def make_icon_image(size: int = 1024) -> Image.Image:
     return img
 
 
-def build_icns(png_path: Path, out_path: Path) -> None:
-    """Convert a PNG to .icns using macOS sips + iconutil."""
-    iconset = png_path.parent / "icon.iconset"
+def build_icns(img: Image.Image, out_path: Path) -> None:
+    """Write an .iconset from the in-memory image and pack it with iconutil."""
+    iconset = out_path.parent / "icon.iconset"
     iconset.mkdir(exist_ok=True)
 
     sizes = [16, 32, 128, 256, 512]
     for s in sizes:
-        subprocess.run(
-            ["sips", "-z", str(s), str(s), str(png_path),
-             "--out", str(iconset / f"icon_{s}x{s}.png")],
-            check=True, capture_output=True,
-        )
-        subprocess.run(
-            ["sips", "-z", str(s * 2), str(s * 2), str(png_path),
-             "--out", str(iconset / f"icon_{s}x{s}@2x.png")],
-            check=True, capture_output=True,
-        )
+        img.resize((s, s), Image.LANCZOS).save(iconset / f"icon_{s}x{s}.png")
+        img.resize((s * 2, s * 2), Image.LANCZOS).save(iconset / f"icon_{s}x{s}@2x.png")
 
     subprocess.run(
         ["iconutil", "-c", "icns", str(iconset), "-o", str(out_path)],
@@ -79,14 +71,11 @@ def build_ico(img: Image.Image, out_path: Path) -> None:
 def main() -> None:
     print("Generating app icons...")
     img = make_icon_image(1024)
-    png_path = SCRIPT_DIR / "icon.png"
-    img.save(str(png_path))
 
     if platform.system() == "Darwin":
-        build_icns(png_path, SCRIPT_DIR / "icon.icns")
+        build_icns(img, SCRIPT_DIR / "icon.icns")
 
     build_ico(img, SCRIPT_DIR / "icon.ico")
-    png_path.unlink()
     print("Done.")
 
 
@@ -8,16 +8,23 @@ from manuscripts.py and shows them in a browser dashboard.
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
+import os
 import platform
 import re
 import socket
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import webbrowser
+import zlib
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 import pystray
@@ -29,6 +36,11 @@ from aiohttp import web
 from zeroconf import IPVersion
 from zeroconf.asyncio import AsyncServiceInfo, AsyncZeroconf
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON for submissions and SSE
+    orjson = None
+
 # ── Embedded browser UI ──────────────────────────────────────────────────────
 
 HTML_PAGE = """\
@@ -105,6 +117,8 @@ HTML_PAGE = """\
     }}
     .col-time  {{ color: var(--dim); width: 5.5rem; white-space: nowrap; }}
     .col-name  {{ color: var(--blue); width: 16rem; }}
+    .col-title a {{ color: inherit; text-decoration: none; }}
+    .col-title a:hover {{ text-decoration: underline; }}
     #empty {{
       color: var(--dim);
       padding: 2rem 0.75rem;
@@ -161,18 +175,32 @@ HTML_PAGE = """\
       const es = _es = new EventSource('/events');
 
       es.addEventListener('submission', e => {{
-        const d = JSON.parse(e.data);
+        // Submissions arriving close together come as one JSON array.
+        const batch = JSON.parse(e.data);
         if (count === 0) {{
           table.style.display = '';
           empty.style.display = 'none';
         }}
-        count++;
-        const tr = document.createElement('tr');
-        tr.innerHTML =
-          '<td class="col-time">' + esc(d.time) + '</td>' +
-          '<td class="col-name">' + esc(d.student) + '</td>' +
-          '<td class="col-title">' + esc(d.title) + '</td>';
-        tbody.prepend(tr);
+        batch.forEach(d => {{
+          count++;
+          const tr = document.createElement('tr');
+          for (const [cls, val] of [['col-time', d.time], ['col-name', d.student]]) {{
+            const td = document.createElement('td');
+            td.className = cls;
+            td.textContent = val;
+            tr.appendChild(td);
+          }}
+          const td = document.createElement('td');
+          td.className = 'col-title';
+          const a = document.createElement('a');
+          a.target = '_blank';
+          a.href = '/file/' + d.file.split('/').map(encodeURIComponent).join('/');
+          a.textContent = d.title;
+          td.appendChild(a);
+          tr.appendChild(td);
+          tbody.prepend(tr);
+        }});
+        const d = batch[batch.length - 1];
         status.textContent = d.student + ' submitted \u201c' + d.title + '\u201d';
         status.className = 'active';
         setTimeout(() => {{ status.textContent = 'receiver'; status.className = ''; }}, 4000);
@@ -185,12 +213,6 @@ HTML_PAGE = """\
       es.onerror = () => setTimeout(connect, 3000);
     }}
 
-    function esc(s) {{
-      return String(s)
-        .replace(/&/g,'&amp;').replace(/</g,'&lt;')
-        .replace(/>/g,'&gt;').replace(/"/g,'&quot;');
-    }}
-
     connect();
   </script>
 </body>
@@ -202,16 +224,26 @@ HTML_PAGE = """\
 _CONFIG_FILE = Path.home() / ".config" / "manuscripts" / "receiver.json"
 _OLD_CONFIG_FILE = Path.home() / ".config" / "manuscripts" / "share.json"
 
-# Migrate share.json → receiver.json on first run
-if _OLD_CONFIG_FILE.exists() and not _CONFIG_FILE.exists():
-    _OLD_CONFIG_FILE.rename(_CONFIG_FILE)
+_migrated = False
 
 
 def _load_config() -> dict:
+    global _migrated
     try:
         return json.loads(_CONFIG_FILE.read_text())
-    except (FileNotFoundError, json.JSONDecodeError):
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        return {}
+    # Migrate share.json → receiver.json on first run
+    if _migrated:
+        return {}
+    _migrated = True
+    try:
+        _OLD_CONFIG_FILE.rename(_CONFIG_FILE)
+    except OSError:
         return {}
+    return _load_config()
 
 
 def _save_config(cfg: dict) -> None:
@@ -221,8 +253,12 @@ def _save_config(cfg: dict) -> None:
 
 # ── Network helpers ──────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _get_local_ip() -> str:
-    """Return the primary LAN IP, preferring physical interfaces over VPN tunnels."""
+    """Return the primary LAN IP, preferring physical interfaces over VPN tunnels.
+
+    Resolved once per process; the LAN address does not change during a class.
+    """
     # Use ifaddr (bundled with zeroconf) to find a physical interface IP.
     try:
         import ifaddr
@@ -247,26 +283,45 @@ def _get_local_ip() -> str:
 _DEFAULT_PORT = 8765
 
 
-def _find_free_port() -> int:
-    """Try the default port first, fall back to a random free one."""
+def _bind_server_socket() -> socket.socket:
+    """Bind the default port if free, else a random one, and return the socket.
+
+    The bound socket is handed straight to aiohttp, so nothing can grab the
+    port between probing it and listening on it.
+    """
     for port in (_DEFAULT_PORT, 0):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(("", port))
-                return s.getsockname()[1]
-            except OSError:
-                continue
-    return _DEFAULT_PORT  # unreachable
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # On Windows SO_REUSEADDR lets another process steal a bound port.
+        if sys.platform != "win32":
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(("0.0.0.0", port))
+            return s
+        except OSError:
+            s.close()
+    raise OSError("no free port")
 
 
 # ── Setup dialog ─────────────────────────────────────────────────────────────
 
+_tk_root: tk.Tk | None = None
+
+
+def _get_tk_root() -> tk.Tk:
+    """Return the process-wide hidden Tk root that dialogs are parented to."""
+    global _tk_root
+    if _tk_root is None:
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()
+    return _tk_root
+
+
 def show_setup_dialog() -> tuple[str, str] | None:
     """Show the name/password dialog. Returns (name, password) or None if cancelled."""
     cfg = _load_config()
     result: list[tuple[str, str] | None] = [None]
 
-    root = tk.Tk()
+    root = tk.Toplevel(_get_tk_root())
     root.title("manuscripts-receiver")
     root.resizable(False, False)
 
@@ -319,13 +374,14 @@ def show_setup_dialog() -> tuple[str, str] | None:
     root.bind("<Escape>", _cancel)
     root.protocol("WM_DELETE_WINDOW", _cancel)
     name_entry.focus_set()
-    root.mainloop()
+    root.wait_window()
 
     return result[0]
 
 
 # ── Tray icon image ──────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def _load_font(size: int, weight: str = "Light") -> "ImageFont.FreeTypeFont | ImageFont.ImageFont":
     from PIL import ImageFont
     names = [f"JetBrainsMono-{weight}.ttf", "JetBrainsMono-Regular.ttf"]
@@ -350,10 +406,17 @@ def _load_font(size: int, weight: str = "Light") -> "ImageFont.FreeTypeFont | Im
     return ImageFont.load_default()
 
 
-def _is_dark_mode() -> bool:
-    """Return True when macOS is in dark mode."""
-    if sys.platform != "darwin":
-        return True  # non-Mac: default to white icon
+_dark_mode: bool | None = None  # cached; refreshed by _watch_appearance
+
+
+def _query_dark_mode() -> bool:
+    """Ask macOS whether dark mode is on, via PyObjC when present."""
+    try:
+        from Foundation import NSUserDefaults
+        style = NSUserDefaults.standardUserDefaults().stringForKey_("AppleInterfaceStyle")
+        return str(style or "").lower() == "dark"
+    except ImportError:
+        pass
     try:
         result = subprocess.run(
             ["defaults", "read", "-g", "AppleInterfaceStyle"],
@@ -364,8 +427,23 @@ def _is_dark_mode() -> bool:
         return False
 
 
+def _is_dark_mode() -> bool:
+    """Return True when macOS is in dark mode."""
+    global _dark_mode
+    if sys.platform != "darwin":
+        return True  # non-Mac: default to white icon
+    if _dark_mode is None:
+        _dark_mode = _query_dark_mode()
+    return _dark_mode
+
+
 def _make_icon_image() -> Image.Image:
-    dark = _is_dark_mode()
+    return _icon_image_for(_is_dark_mode())
+
+
+@functools.lru_cache(maxsize=2)
+def _icon_image_for(dark: bool) -> Image.Image:
+    """Render the tray icon for one appearance; there are only ever two."""
     fill = "#FFFFFF" if dark else "#000000"
     outline = (255, 255, 255, 60) if dark else (0, 0, 0, 60)
 
@@ -384,22 +462,51 @@ def _make_icon_image() -> Image.Image:
     return img
 
 
-def _watch_appearance() -> None:
-    """Poll for macOS appearance changes and redraw the tray icon."""
-    current = _is_dark_mode()
+def _on_appearance_changed() -> None:
+    global _dark_mode
+    new = _query_dark_mode()
+    if new != _dark_mode:
+        _dark_mode = new
+        if _tray_icon is not None:
+            _tray_icon.icon = _make_icon_image()
+
+
+_appearance_observer = None  # strong ref; the notification center doesn't retain it
+
+
+def _poll_appearance() -> None:
+    """Fallback without PyObjC: re-check the appearance every 30 s."""
     while True:
-        time.sleep(3)
-        new = _is_dark_mode()
-        if new != current:
-            current = new
-            if _tray_icon is not None:
-                _tray_icon.icon = _make_icon_image()
+        time.sleep(30)
+        _on_appearance_changed()
+
+
+def _watch_appearance() -> None:
+    """Redraw the tray icon when macOS switches between light and dark mode."""
+    global _appearance_observer
+    _is_dark_mode()
+    try:
+        from Foundation import NSDistributedNotificationCenter, NSObject
+    except ImportError:
+        threading.Thread(target=_poll_appearance, daemon=True).start()
+        return
+
+    class _AppearanceObserver(NSObject):
+        def themeChanged_(self, notification):
+            _on_appearance_changed()
+
+    # Delivered on the main thread, i.e. pystray's NSApplication run loop.
+    _appearance_observer = _AppearanceObserver.new()
+    NSDistributedNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+        _appearance_observer, "themeChanged:",
+        "AppleInterfaceThemeChangedNotification", None,
+    )
 
 
 def _setup_tray(icon: "pystray.Icon") -> None:
     icon.visible = True
     if sys.platform == "darwin":
-        threading.Thread(target=_watch_appearance, daemon=True).start()
+        _watch_appearance()
 
 
 # ── Global server state (shared across threads) ───────────────────────────────
@@ -463,48 +570,36 @@ def _prompt_password() -> str | None:
                 return part[len("text returned:"):]
         return ""
     else:
-        # Windows: tkinter works fine from a non-main thread
+        # Windows: pystray runs menu callbacks on the main thread, which owns
+        # the shared Tk root created for the setup dialog.
         from tkinter import simpledialog
-        result: list[str | None] = [None]
-        done = threading.Event()
-
-        def _show() -> None:
-            root = tk.Tk()
-            root.withdraw()
-            pw = simpledialog.askstring(
-                "Change Password",
-                "New submission password\n(leave blank to remove):",
-                show="\u2022",
-                parent=root,
-            )
-            root.destroy()
-            result[0] = pw
-            done.set()
-
-        threading.Thread(target=_show, daemon=True).start()
-        done.wait(timeout=60)
-        return result[0]
+        return simpledialog.askstring(
+            "Change Password",
+            "New submission password\n(leave blank to remove):",
+            show="\u2022",
+            parent=_get_tk_root(),
+        )
 
 
 async def _reregister_mdns(new_pw: str) -> None:
-    """Re-register the mDNS service with an updated auth flag."""
+    """Update the advertised mDNS auth flag in place.
+
+    Reuses the addresses already advertised rather than re-resolving the IP.
+    """
     global _mdns_info
     if _mdns_zc is None or _mdns_info is None:
         return
-    await _mdns_zc.async_unregister_service(_mdns_info)
-    new_info = AsyncServiceInfo(
-        type_="_manuscripts._tcp.local.",
-        name=f"{_mdns_teacher_name}._manuscripts._tcp.local.",
-        addresses=_mdns_info.addresses,
-        port=_mdns_info.port,
-        properties={
-            "teacher": _mdns_teacher_name,
-            "version": "1",
-            "auth": "1" if new_pw else "0",
-        },
-        server=_mdns_info.server,
+    new_info = _service_info(
+        _mdns_teacher_name, _mdns_info.addresses, _mdns_info.port,
+        _mdns_info.server, bool(new_pw),
     )
-    await _mdns_zc.async_register_service(new_info)
+    try:
+        # Re-announces the TXT record without a goodbye/re-probe cycle.
+        await _mdns_zc.async_update_service(new_info)
+    except AttributeError:
+        # Older zeroconf without update support
+        await _mdns_zc.async_unregister_service(_mdns_info)
+        await _mdns_zc.async_register_service(new_info)
     _mdns_info = new_info
 
 
@@ -534,44 +629,184 @@ def _on_submission() -> None:
 
 # ── SSE manager ──────────────────────────────────────────────────────────────
 
+_SSE_KEEPALIVE = b": keepalive\n\n"
+_SSE_KEEPALIVE_INTERVAL = 20.0  # seconds
+_SSE_BUFFER_MAX = 256  # frames kept for clients to catch up on
+_SSE_COALESCE_WINDOW = 0.01  # seconds to wait for more frames after the first
+_SSE_BATCH_WINDOW = 0.075  # seconds submission events are held to batch together
+_SSE_BATCH_MAX = 32  # submission events per batched frame at most
+
+
 class SSEManager:
-    def __init__(self) -> None:
-        self._queues: list[asyncio.Queue] = []
+    """Fan out events through one shared ring buffer of encoded frames.
 
-    def connect(self) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue()
-        self._queues.append(q)
-        return q
+    Each client only remembers the sequence number of the last frame it
+    wrote; broadcast appends once and wakes every waiting client.
+    """
 
-    def disconnect(self, q: asyncio.Queue) -> None:
-        try:
-            self._queues.remove(q)
-        except ValueError:
-            pass
+    def __init__(self) -> None:
+        self._buf: deque[tuple[int, bytes]] = deque(maxlen=_SSE_BUFFER_MAX)
+        self._seq = 0
+        self._tick = asyncio.Event()
+        self._clients = 0
+        self._batch: list[bytes] = []
+        self._batch_task: asyncio.Task | None = None
+
+    def connect(self) -> int:
+        """Register a client and return the sequence number it starts after."""
+        self._clients += 1
+        return self._seq
+
+    def disconnect(self) -> None:
+        self._clients -= 1
+
+    async def broadcast(self, event: str, data: str | bytes) -> None:
+        if isinstance(data, str):
+            data = data.encode()
+        self._seq += 1
+        self._buf.append(
+            (self._seq, b"event: " + event.encode() + b"\ndata: " + data + b"\n\n")
+        )
+        self._tick.set()
+        self._tick.clear()
+
+    async def broadcast_batched(self, event: str, data: bytes) -> None:
+        """Queue a JSON object to go out with others as one JSON-array frame.
+
+        Only one event name is batched at a time (submissions).
+        """
+        self._batch.append(data)
+        if len(self._batch) >= _SSE_BATCH_MAX:
+            if self._batch_task is not None:
+                self._batch_task.cancel()
+            await self._flush_batch(event)
+        elif self._batch_task is None:
+            self._batch_task = asyncio.create_task(self._flush_batch_later(event))
+
+    async def _flush_batch_later(self, event: str) -> None:
+        await asyncio.sleep(_SSE_BATCH_WINDOW)
+        await self._flush_batch(event)
+
+    async def _flush_batch(self, event: str) -> None:
+        batch, self._batch, self._batch_task = self._batch, [], None
+        if batch:
+            await self.broadcast(event, b"[" + b",".join(batch) + b"]")
+
+    def pending(self, last_seq: int) -> bool:
+        return self._seq > last_seq
+
+    async def wait(self) -> None:
+        await self._tick.wait()
+
+    def frames_since(self, last_seq: int) -> list[bytes] | None:
+        """Return frames newer than last_seq, or None if some were already evicted."""
+        n = self._seq - last_seq
+        if n > len(self._buf):
+            return None
+        return [frame for _, frame in islice(self._buf, len(self._buf) - n, None)]
 
-    async def broadcast(self, event: str, data: str) -> None:
-        dead = []
-        for q in list(self._queues):
-            try:
-                q.put_nowait(f"event: {event}\ndata: {data}\n\n")
-            except Exception:
-                dead.append(q)
-        for q in dead:
-            self.disconnect(q)
+    @property
+    def seq(self) -> int:
+        return self._seq
 
     @property
     def count(self) -> int:
-        return len(self._queues)
+        return self._clients
 
 
 # ── HTTP handlers ────────────────────────────────────────────────────────────
 
+_SUBMISSIONS_DIR = Path.home() / "Downloads" / "Submissions"
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+_FILE_CHUNK_SIZE = 256 * 1024
+_TEXT_FIELD_MAX = 4096  # student / title / password
+_LASTNAME_RE = re.compile(r"[^\w\-]")
+_TITLE_RE = re.compile(r"[^\w\s\-]")
+
+
+def _json_bytes(obj: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_response(obj: dict, status: int = 200) -> web.Response:
+    return web.Response(body=_json_bytes(obj), status=status, content_type="application/json")
+
+
+async def _read_text_field(part) -> str:
+    """Read a small multipart text field, refusing anything over _TEXT_FIELD_MAX bytes."""
+    data = bytearray()
+    while True:
+        chunk = await part.read_chunk(_TEXT_FIELD_MAX)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > _TEXT_FIELD_MAX:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=_TEXT_FIELD_MAX, actual_size=len(data),
+            )
+    return data.decode("utf-8", errors="replace").strip()
+
+
+@functools.lru_cache(maxsize=512)
+def _safe_stem(student: str, title: str) -> str:
+    """Return the "Lastname-Title" filename stem, stripped of unsafe characters."""
+    last_name = student.strip().split()[-1] if student.strip() else "Unknown"
+    safe_last = _LASTNAME_RE.sub("", last_name)[:30]
+    safe_title = _TITLE_RE.sub("", title).strip()[:50]
+    return f"{safe_last}-{safe_title}"
+
+
+def _claim_unique_path(save_dir: Path, stem: str, ext: str) -> Path:
+    """Atomically create an empty file named stem+ext (or "stem (N)ext") and return it."""
+    dest = save_dir / f"{stem}{ext}"
+    i = None
+    while True:
+        try:
+            fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            if i is None:
+                # One directory scan finds the highest "stem (N)" in use,
+                # rather than probing (2), (3), ... one stat at a time.
+                dup_re = re.compile(rf"{re.escape(stem)} \((\d+)\){re.escape(ext)}")
+                with os.scandir(save_dir) as it:
+                    used = [int(m[1]) for e in it if (m := dup_re.fullmatch(e.name))]
+                i = max(used, default=1) + 1
+            else:
+                i += 1
+            dest = save_dir / f"{stem} ({i}){ext}"
+            continue
+        os.close(fd)
+        return dest
+
+
+def _submission_dir(app: web.Application, now: datetime, refresh: bool = False) -> Path:
+    """Return today's submissions folder, creating it on the first use each day.
+
+    Pass refresh=True after a FileNotFoundError (the teacher moved or deleted
+    the folder mid-session) to forget the cached folder and recreate it.
+    """
+    cache = app["save_dir_cache"]
+    if refresh:
+        cache["date"] = None
+    date_str = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+    if cache["date"] != date_str:
+        path = _SUBMISSIONS_DIR / date_str
+        path.mkdir(parents=True, exist_ok=True)
+        cache["date"], cache["path"] = date_str, path
+        cache["digests"] = {}
+    return cache["path"]
+
+
 async def handle_index(request: web.Request) -> web.Response:
-    return web.Response(text=request.app["html"], content_type="text/html")
+    return web.Response(
+        body=request.app["html_bytes"], content_type="text/html", charset="utf-8",
+    )
 
 
-async def handle_font(request: web.Request) -> web.Response:
-    """Serve the JetBrains Mono font for the dashboard."""
+def _find_dashboard_font() -> Path | None:
+    """Locate the JetBrains Mono font bundled for the dashboard."""
     font_name = "JetBrainsMono-Regular.ttf"
     candidates = [
         *(
@@ -582,33 +817,88 @@ async def handle_font(request: web.Request) -> web.Response:
     ]
     for p in candidates:
         if p.exists():
-            return web.FileResponse(p, headers={"Cache-Control": "max-age=86400"})
-    return web.Response(status=404)
+            return p
+    return None
+
+
+async def handle_font(request: web.Request) -> web.StreamResponse:
+    """Serve the JetBrains Mono font for the dashboard."""
+    font_path: Path | None = request.app["font_path"]
+    if font_path is None:
+        return web.Response(status=404)
+    # FileResponse uses sendfile; the font never changes while we run.
+    return web.FileResponse(
+        font_path, headers={"Cache-Control": "max-age=31536000, immutable"},
+    )
+
+
+async def handle_file(request: web.Request) -> web.StreamResponse:
+    """Serve a received submission to the teacher's own browser."""
+    # The dashboard is reachable from the whole LAN; only the teacher's
+    # machine may read student work back.
+    if request.remote not in ("127.0.0.1", "::1"):
+        return web.Response(status=403)
+    root = _SUBMISSIONS_DIR.resolve()
+    dest = (root / request.match_info["date"] / request.match_info["name"]).resolve()
+    if not dest.is_relative_to(root) or not dest.is_file():
+        return web.Response(status=404)
+    # FileResponse uses sendfile, so the PDF never passes through Python.
+    return web.FileResponse(dest, chunk_size=_FILE_CHUNK_SIZE)
 
 
 async def handle_events(request: web.Request) -> web.StreamResponse:
     sse: SSEManager = request.app["sse"]
-    q = sse.connect()
-    resp = web.StreamResponse(headers={
-        "Content-Type": "text/event-stream",
-        "Cache-Control": "no-cache",
-        "X-Accel-Buffering": "no",
-    })
-    await resp.prepare(request)
-    await resp.write(f"event: count\ndata: {sse.count}\n\n".encode())
-    await sse.broadcast("count", str(sse.count))
+    last_seq = sse.connect()
     try:
+        headers = {
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+        # aiohttp's enable_compression() buffers inside zlib until the
+        # response ends, which would hold events back, so compress here and
+        # sync-flush after every write instead.
+        gz = None
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            gz = zlib.compressobj(wbits=31)
+            headers["Content-Encoding"] = "gzip"
+        resp = web.StreamResponse(headers=headers)
+        await resp.prepare(request)
+
+        async def send(data: bytes) -> None:
+            if gz is not None:
+                data = gz.compress(data) + gz.flush(zlib.Z_SYNC_FLUSH)
+            await resp.write(data)
+
+        await send(b"event: count\ndata: %d\n\n" % sse.count)
+        await sse.broadcast("count", b"%d" % sse.count)
+        # One fixed keepalive deadline, moved only when a keepalive is sent,
+        # instead of a fresh 20 s timer after every event.
+        loop = asyncio.get_running_loop()
+        next_keepalive = loop.time() + _SSE_KEEPALIVE_INTERVAL
         while True:
-            try:
-                chunk = await asyncio.wait_for(q.get(), timeout=20.0)
-                await resp.write(chunk.encode())
-            except asyncio.TimeoutError:
-                await resp.write(b": keepalive\n\n")
+            if not sse.pending(last_seq):
+                try:
+                    await asyncio.wait_for(
+                        sse.wait(), timeout=max(0.0, next_keepalive - loop.time()),
+                    )
+                except asyncio.TimeoutError:
+                    await send(_SSE_KEEPALIVE)
+                    next_keepalive = loop.time() + _SSE_KEEPALIVE_INTERVAL
+                    continue
+            # Give a burst of submissions a moment to land, then ship
+            # everything pending in a single write.
+            await asyncio.sleep(_SSE_COALESCE_WINDOW)
+            frames = sse.frames_since(last_seq)
+            if frames is None:
+                break  # fell behind the ring buffer; the browser reconnects
+            last_seq = sse.seq
+            await send(b"".join(frames))
     except ConnectionResetError:
         pass
     finally:
-        sse.disconnect(q)
-        await sse.broadcast("count", str(sse.count))
+        sse.disconnect()
+        await sse.broadcast("count", b"%d" % sse.count)
     return resp
 
 
@@ -616,83 +906,129 @@ async def handle_submit(request: web.Request) -> web.Response:
     sse: SSEManager = request.app["sse"]
     required_password: str = request.app["password_ref"][0]
     on_sub = request.app["on_submission"]
+    tmp_path: Path | None = None
+    digest = None
     try:
         reader = await request.multipart()
         student = ""
         title = ""
-        file_bytes = b""
         ext = ".pdf"
         submitted_password = ""
 
+        now = datetime.now()
+
         async for part in reader:
             if part.name == "student":
-                student = (await part.read()).decode("utf-8", errors="replace").strip()
+                student = await _read_text_field(part)
             elif part.name == "title":
-                title = (await part.read()).decode("utf-8", errors="replace").strip()
+                title = await _read_text_field(part)
             elif part.name == "file":
-                file_bytes = await part.read()
                 ct = part.headers.get("Content-Type", "application/pdf")
                 if "markdown" in ct or "text/plain" in ct:
                     ext = ".md"
+                # Stream straight to a hidden temp file; renamed into place
+                # once the student/title (and so the final name) are known.
+                save_dir = _submission_dir(request.app, now)
+                try:
+                    fd, tmp_name = tempfile.mkstemp(dir=save_dir, prefix=".", suffix=".part")
+                except FileNotFoundError:
+                    save_dir = _submission_dir(request.app, now, refresh=True)
+                    fd, tmp_name = tempfile.mkstemp(dir=save_dir, prefix=".", suffix=".part")
+                tmp_path = Path(tmp_name)
+                # Hashed as it streams, so spotting an identical resubmit
+                # costs no second pass over the file.
+                h = hashlib.sha256()
+                with os.fdopen(fd, "wb") as f:
+                    while True:
+                        chunk = await part.read_chunk(_UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        h.update(chunk)
+                        f.write(chunk)
+                digest = h.hexdigest()
             elif part.name == "password":
-                submitted_password = (await part.read()).decode("utf-8", errors="replace").strip()
+                submitted_password = await _read_text_field(part)
 
         if required_password and submitted_password != required_password:
-            return web.json_response({"ok": False, "error": "Incorrect password"}, status=401)
+            return _json_response({"ok": False, "error": "Incorrect password"}, status=401)
 
         student = student or "Unknown Student"
         title = title or "Untitled"
 
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        save_dir = Path.home() / "Downloads" / "Submissions" / date_str
-        save_dir.mkdir(parents=True, exist_ok=True)
-
-        last_name = student.strip().split()[-1] if student.strip() else "Unknown"
-        safe_last = re.sub(r"[^\w\-]", "", last_name)[:30]
-        safe_title = re.sub(r"[^\w\s\-]", "", title).strip()[:50]
-        dest = save_dir / f"{safe_last}-{safe_title}{ext}"
-        if dest.exists():
-            stem, suffix, i = dest.stem, dest.suffix, 2
-            while dest.exists():
-                dest = save_dir / f"{stem} ({i}){suffix}"
-                i += 1
+        save_dir = _submission_dir(request.app, now)
+
+        # Identical resubmission of the same piece today: keep the copy we
+        # have (the temp file is dropped in finally) and stay quiet.
+        digests: dict = request.app["save_dir_cache"]["digests"]
+        key = (student, title, digest)
+        if digest is not None and key in digests and digests[key].exists():
+            return _json_response({"ok": True, "saved": str(digests[key]), "duplicate": True})
 
-        dest.write_bytes(file_bytes)
+        try:
+            dest = _claim_unique_path(save_dir, _safe_stem(student, title), ext)
+        except FileNotFoundError:
+            save_dir = _submission_dir(request.app, now, refresh=True)
+            dest = _claim_unique_path(save_dir, _safe_stem(student, title), ext)
+        if tmp_path is not None:
+            tmp_path.replace(dest)
+            tmp_path = None
+            request.app["save_dir_cache"]["digests"][key] = dest
         on_sub()
 
-        event_data = json.dumps({
-            "time": datetime.now().strftime("%H:%M"),
+        event_data = _json_bytes({
+            "time": f"{now.hour:02d}:{now.minute:02d}",
             "student": student,
             "title": title,
             "path": str(dest),
+            "file": f"{save_dir.name}/{dest.name}",
         })
-        await sse.broadcast("submission", event_data)
+        await sse.broadcast_batched("submission", event_data)
 
-        return web.json_response({"ok": True, "saved": str(dest)})
+        return _json_response({"ok": True, "saved": str(dest)})
+    except web.HTTPRequestEntityTooLarge:
+        return _json_response({"ok": False, "error": "Form field too large"}, status=413)
     except Exception as exc:
-        return web.json_response({"ok": False, "error": str(exc)}, status=500)
+        return _json_response({"ok": False, "error": str(exc)}, status=500)
+    finally:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
 
 # ── mDNS advertisement ───────────────────────────────────────────────────────
 
-async def advertise_mdns(
-    teacher_name: str,
-    port: int,
-    zc: AsyncZeroconf,
-    password: str = "",
+def _service_info(
+    teacher_name: str, addresses: list[bytes], port: int, server: str, auth: bool,
 ) -> AsyncServiceInfo:
-    hostname = socket.gethostname()
-    info = AsyncServiceInfo(
+    # TXT properties are passed as bytes so zeroconf skips its own encoding.
+    return AsyncServiceInfo(
         type_="_manuscripts._tcp.local.",
         name=f"{teacher_name}._manuscripts._tcp.local.",
-        addresses=[socket.inet_aton(_get_local_ip())],
+        addresses=addresses,
         port=port,
         properties={
-            "teacher": teacher_name,
-            "version": "1",
-            "auth": "1" if password else "0",
+            b"teacher": teacher_name.encode(),
+            b"version": b"1",
+            b"auth": b"1" if auth else b"0",
         },
-        server=f"{hostname}.local.",
+        server=server,
+    )
+
+
+async def advertise_mdns(
+    teacher_name: str,
+    port: int,
+    zc: AsyncZeroconf,
+    password: str = "",
+) -> AsyncServiceInfo:
+    info = _service_info(
+        teacher_name,
+        [socket.inet_aton(_get_local_ip())],
+        port,
+        f"{socket.gethostname()}.local.",
+        bool(password),
     )
     await zc.async_register_service(info)
     return info
@@ -701,27 +1037,36 @@ async def advertise_mdns(
 # ── Server setup ─────────────────────────────────────────────────────────────
 
 async def run_server(
-    teacher_name: str, port: int, password_ref: list[str] | None = None, on_submission=None
+    teacher_name: str,
+    sock: socket.socket,
+    password_ref: list[str] | None = None,
+    on_submission=None,
 ) -> web.AppRunner:
     sse = SSEManager()
     app = web.Application()
     app["sse"] = sse
     app["password_ref"] = password_ref if password_ref is not None else _password_ref
-    app["html"] = HTML_PAGE.format(teacher_name=teacher_name)
+    app["html_bytes"] = HTML_PAGE.format(teacher_name=teacher_name).encode("utf-8")
     app["on_submission"] = on_submission or (lambda: None)
+    app["font_path"] = _find_dashboard_font()
+    app["save_dir_cache"] = {"date": None, "path": None, "digests": {}}
     app.router.add_get("/", handle_index)
     app.router.add_get("/events", handle_events)
     app.router.add_post("/submit", handle_submit)
     app.router.add_get("/font/JetBrainsMono-Regular.ttf", handle_font)
+    app.router.add_get("/file/{date}/{name}", handle_file)
     runner = web.AppRunner(app)
     await runner.setup()
-    await web.TCPSite(runner, "0.0.0.0", port).start()
+    # aiohttp already enables TCP_NODELAY per connection, so small SSE
+    # frames go out immediately. The socket comes pre-bound (with
+    # SO_REUSEADDR) from _bind_server_socket.
+    await web.SockSite(runner, sock).start()
     return runner
 
 
 # ── Asyncio server thread ────────────────────────────────────────────────────
 
-def _run_server_thread(teacher_name: str, port: int, password: str) -> None:
+def _run_server_thread(teacher_name: str, sock: socket.socket, password: str) -> None:
     global _asyncio_loop, _stop_event, _mdns_zc, _mdns_info, _mdns_teacher_name
     _password_ref[0] = password
     _mdns_teacher_name = teacher_name
@@ -731,9 +1076,9 @@ def _run_server_thread(teacher_name: str, port: int, password: str) -> None:
         _asyncio_loop = asyncio.get_running_loop()
         _stop_event = asyncio.Event()
 
-        runner = await run_server(teacher_name, port, _password_ref, _on_submission)
+        runner = await run_server(teacher_name, sock, _password_ref, _on_submission)
         zc = AsyncZeroconf(ip_version=IPVersion.V4Only)
-        info = await advertise_mdns(teacher_name, port, zc, password)
+        info = await advertise_mdns(teacher_name, sock.getsockname()[1], zc, password)
         _mdns_zc = zc
         _mdns_info = info
 
@@ -744,7 +1089,15 @@ def _run_server_thread(teacher_name: str, port: int, password: str) -> None:
         await zc.async_close()
         await runner.cleanup()
 
-    asyncio.run(_main())
+    # uvloop (libuv) is optional and has no Windows build. uvloop.run gives
+    # this thread its own uvloop loop without touching the process-wide
+    # event-loop policy (uvloop.install is deprecated).
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_main())
+    else:
+        uvloop.run(_main())
 
 
 # ── Entry point ──────────────────────────────────────────────────────────────
@@ -757,13 +1110,14 @@ def main() -> None:
         sys.exit(0)
     teacher_name, password = setup
 
-    port = _find_free_port()
+    sock = _bind_server_socket()
+    port = sock.getsockname()[1]
     _dashboard_url = f"http://localhost:{port}/"
 
     # Start aiohttp + zeroconf in background thread
     server_thread = threading.Thread(
         target=_run_server_thread,
-        args=(teacher_name, port, password),
+        args=(teacher_name, sock, password),
         daemon=True,
     )
     server_thread.start()
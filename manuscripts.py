@@ -12,19 +12,23 @@ Python 3.9+ and a modern terminal are available.
 from __future__ import annotations
 
 import asyncio
-import io
+import atexit
+import functools
 import json
 import os
 import re
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
 import time
 import zipfile
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from difflib import SequenceMatcher
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -47,6 +51,16 @@ from prompt_toolkit.styles import Style as PtStyle
 from prompt_toolkit.utils import get_cwidth
 from prompt_toolkit.widgets import Button, Dialog, Label, TextArea
 
+try:
+    import orjson
+except ImportError:  # optional: faster project load/save
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:  # optional: C++ fuzzy matching, falls back to difflib
+    _rf_fuzz = _rf_process = None
+
 # ════════════════════════════════════════════════════════════════════════
 #  Config
 # ════════════════════════════════════════════════════════════════════════
@@ -74,6 +88,9 @@ def _save_config(cfg: dict) -> None:
 # ════════════════════════════════════════════════════════════════════════
 
 
+_NON_AZ_BYTES = bytes(c for c in range(128) if not 97 <= c <= 122)
+
+
 @dataclass
 class Source:
     """A bibliographic source with simplified metadata."""
@@ -99,107 +116,139 @@ class Source:
     access_date: str = ""
     site_name: str = ""
 
+    def to_dict(self) -> dict:
+        """Field values as a plain dict; asdict() without the deepcopy."""
+        return {name: getattr(self, name) for name in _SOURCE_FIELDS}
+
+    @functools.cached_property
+    def _haystack(self) -> str:
+        """Lower-cased text that fuzzy_filter searches."""
+        return f"{self.author} {self.title} {self.year}".lower()
+
     # ── Citation formatting (Chicago / Turabian) ──────────────────────
 
     def to_citekey(self) -> str:
         last = self.author.split(",")[0].split()[-1].lower() if self.author else "unknown"
-        return re.sub(r"[^a-z]", "", last) + self.year
+        # Keep only a-z: drop non-ASCII, then delete every other ASCII byte.
+        return last.encode("ascii", "ignore").translate(None, _NON_AZ_BYTES).decode() + self.year
 
     def to_chicago_footnote(self, page: str = "") -> str:
-        a = self._author_first()
-        if self.source_type == "book":
-            c = f"{a}, *{self.title}*" if a else f"*{self.title}*"
-            if self.publisher:
-                c += f" ({self.publisher}, {self.year})"
-            elif self.year:
-                c += f" ({self.year})"
-            if page:
-                c += f", {page}"
-            return c + "."
-        if self.source_type == "article":
-            c = f'{a}, "{self.title},"' if a else f'"{self.title},"'
-            c += f" *{self.journal}*"
-            if self.volume:
-                c += f" {self.volume}"
-                if self.issue:
-                    c += f", no. {self.issue}"
-            if self.year:
-                c += f" ({self.year})"
-            if self.pages:
-                c += f": {self.pages}"
-            elif page:
-                c += f": {page}"
-            return c + "."
-        if self.source_type == "book_section":
-            c = f'{a}, "{self.title},"' if a else f'"{self.title},"'
-            c += f" in *{self.book_title}*"
-            if self.editor:
-                c += f", ed. {self.editor}"
-            if self.publisher:
-                c += f" ({self.publisher}, {self.year})"
-            elif self.year:
-                c += f" ({self.year})"
-            if self.pages:
-                c += f", {self.pages}"
-            elif page:
-                c += f", {page}"
-            return c + "."
-        if self.source_type == "website":
-            c = f'{a}, "{self.title},"' if a else f'"{self.title},"'
-            if self.site_name:
-                c += f" *{self.site_name}*,"
-            if self.access_date:
-                c += f" accessed {self.access_date},"
-            if self.url:
-                c += f" {self.url}"
-            return c.rstrip(",") + "."
+        fmt = _FOOTNOTE_FORMATTERS.get(self.source_type, Source._foot_default)
+        return fmt(self, self._author_first(), page)
+
+    def to_chicago_bibliography(self) -> str:
+        fmt = _BIBLIOGRAPHY_FORMATTERS.get(self.source_type, Source._bib_default)
+        return fmt(self, self._author_last())
+
+    # ── footnote formatters (one per source_type) ─────────────────────
+
+    def _foot_book(self, a: str, page: str) -> str:
+        parts = [f"{a}, *{self.title}*" if a else f"*{self.title}*"]
+        if self.publisher:
+            parts.append(f" ({self.publisher}, {self.year})")
+        elif self.year:
+            parts.append(f" ({self.year})")
+        if page:
+            parts.append(f", {page}")
+        parts.append(".")
+        return "".join(parts)
+
+    def _foot_article(self, a: str, page: str) -> str:
+        parts = [f'{a}, "{self.title},"' if a else f'"{self.title},"',
+                 f" *{self.journal}*"]
+        if self.volume:
+            parts.append(f" {self.volume}")
+            if self.issue:
+                parts.append(f", no. {self.issue}")
+        if self.year:
+            parts.append(f" ({self.year})")
+        if self.pages:
+            parts.append(f": {self.pages}")
+        elif page:
+            parts.append(f": {page}")
+        parts.append(".")
+        return "".join(parts)
+
+    def _foot_book_section(self, a: str, page: str) -> str:
+        parts = [f'{a}, "{self.title},"' if a else f'"{self.title},"',
+                 f" in *{self.book_title}*"]
+        if self.editor:
+            parts.append(f", ed. {self.editor}")
+        if self.publisher:
+            parts.append(f" ({self.publisher}, {self.year})")
+        elif self.year:
+            parts.append(f" ({self.year})")
+        if self.pages:
+            parts.append(f", {self.pages}")
+        elif page:
+            parts.append(f", {page}")
+        parts.append(".")
+        return "".join(parts)
+
+    def _foot_website(self, a: str, page: str) -> str:
+        parts = [f'{a}, "{self.title},"' if a else f'"{self.title},"']
+        if self.site_name:
+            parts.append(f" *{self.site_name}*,")
+        if self.access_date:
+            parts.append(f" accessed {self.access_date},")
+        if self.url:
+            parts.append(f" {self.url}")
+        return "".join(parts).rstrip(",") + "."
+
+    def _foot_default(self, a: str, page: str) -> str:
         if a:
             return f"{a}, *{self.title}* ({self.year})."
         return f"*{self.title}* ({self.year})."
 
-    def to_chicago_bibliography(self) -> str:
-        a = self._author_last()
-        if self.source_type == "book":
-            c = f"{a}. *{self.title}*." if a else f"*{self.title}*."
-            if self.publisher:
-                c += f" {self.publisher}, {self.year}."
-            elif self.year:
-                c += f" {self.year}."
-            return c
-        if self.source_type == "article":
-            c = f'{a}. "{self.title}."' if a else f'"{self.title}."'
-            c += f" *{self.journal}*"
-            if self.volume:
-                c += f" {self.volume}"
-                if self.issue:
-                    c += f", no. {self.issue}"
-            if self.year:
-                c += f" ({self.year})"
-            if self.pages:
-                c += f": {self.pages}"
-            return c + "."
-        if self.source_type == "book_section":
-            c = f'{a}. "{self.title}."' if a else f'"{self.title}."'
-            c += f" In *{self.book_title}*"
-            if self.editor:
-                c += f", edited by {self.editor}"
-            if self.pages:
-                c += f", {self.pages}"
-            c += "."
-            if self.publisher:
-                c += f" {self.publisher}, {self.year}."
-            elif self.year:
-                c += f" {self.year}."
-            return c
-        if self.source_type == "website":
-            c = f'{a}. "{self.title}."' if a else f'"{self.title}."'
-            if self.site_name:
-                c += f" *{self.site_name}*."
-            if self.access_date:
-                c += f" Accessed {self.access_date}."
-            if self.url:
-                c += f" {self.url}."
-            return c
+    # ── bibliography formatters (one per source_type) ─────────────────
+
+    def _bib_book(self, a: str) -> str:
+        parts = [f"{a}. *{self.title}*." if a else f"*{self.title}*."]
+        if self.publisher:
+            parts.append(f" {self.publisher}, {self.year}.")
+        elif self.year:
+            parts.append(f" {self.year}.")
+        return "".join(parts)
+
+    def _bib_article(self, a: str) -> str:
+        parts = [f'{a}. "{self.title}."' if a else f'"{self.title}."',
+                 f" *{self.journal}*"]
+        if self.volume:
+            parts.append(f" {self.volume}")
+            if self.issue:
+                parts.append(f", no. {self.issue}")
+        if self.year:
+            parts.append(f" ({self.year})")
+        if self.pages:
+            parts.append(f": {self.pages}")
+        parts.append(".")
+        return "".join(parts)
+
+    def _bib_book_section(self, a: str) -> str:
+        parts = [f'{a}. "{self.title}."' if a else f'"{self.title}."',
+                 f" In *{self.book_title}*"]
+        if self.editor:
+            parts.append(f", edited by {self.editor}")
+        if self.pages:
+            parts.append(f", {self.pages}")
+        parts.append(".")
+        if self.publisher:
+            parts.append(f" {self.publisher}, {self.year}.")
+        elif self.year:
+            parts.append(f" {self.year}.")
+        return "".join(parts)
+
+    def _bib_website(self, a: str) -> str:
+        parts = [f'{a}. "{self.title}."' if a else f'"{self.title}."']
+        if self.site_name:
+            parts.append(f" *{self.site_name}*.")
+        if self.access_date:
+            parts.append(f" Accessed {self.access_date}.")
+        if self.url:
+            parts.append(f" {self.url}.")
+        return "".join(parts)
+
+    def _bib_default(self, a: str) -> str:
         if a:
             return f"{a}. *{self.title}*. {self.year}."
         return f"*{self.title}*. {self.year}."
@@ -226,6 +275,24 @@ class Source:
         return self.author
 
 
+_SOURCE_FIELDS = tuple(f.name for f in fields(Source))
+_SOURCE_FIELD_SET = frozenset(_SOURCE_FIELDS)
+_SOURCE_REQUIRED = frozenset(f.name for f in fields(Source) if f.default is MISSING)
+
+_FOOTNOTE_FORMATTERS = {
+    "book": Source._foot_book,
+    "article": Source._foot_article,
+    "book_section": Source._foot_book_section,
+    "website": Source._foot_website,
+}
+_BIBLIOGRAPHY_FORMATTERS = {
+    "book": Source._bib_book,
+    "article": Source._bib_article,
+    "book_section": Source._bib_book_section,
+    "website": Source._bib_website,
+}
+
+
 @dataclass
 class Project:
     """A writing project."""
@@ -238,26 +305,50 @@ class Project:
     sources: list = field(default_factory=list)
 
     def get_sources(self) -> list[Source]:
-        out: list[Source] = []
-        for s in self.sources:
-            try:
-                out.append(Source(**s))
-            except TypeError:
-                continue
-        return out
+        # Malformed entries (a required field missing, or a key Source does
+        # not know) are skipped; checking the keys up front avoids raising
+        # and catching a TypeError per entry.
+        return [
+            Source(**s) for s in self.sources
+            if _SOURCE_REQUIRED <= s.keys() <= _SOURCE_FIELD_SET
+        ]
 
     def add_source(self, source: Source) -> None:
-        self.sources.append(asdict(source))
+        self.sources.append(source.to_dict())
 
     def remove_source(self, source_id: str) -> None:
         self.sources = [s for s in self.sources if s.get("id") != source_id]
 
+    def to_dict(self) -> dict:
+        """The on-disk form; sources are already plain dicts."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "created": self.created,
+            "modified": self.modified,
+            "content": self.content,
+            "sources": self.sources,
+        }
+
 
 # ════════════════════════════════════════════════════════════════════════
 #  Storage
 # ════════════════════════════════════════════════════════════════════════
 
 
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj as indented JSON bytes (the on-disk project format)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
 class Storage:
     def __init__(self, base: Path) -> None:
         self.base = base
@@ -266,28 +357,53 @@ class Storage:
         self.projects_dir.mkdir(parents=True, exist_ok=True)
         self.exports_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _load_one(path: Path) -> Optional[Project]:
+        try:
+            return Project(**_json_loads(path.read_bytes()))
+        except (json.JSONDecodeError, TypeError, KeyError):
+            return None
+
     def list_projects(self) -> list[Project]:
-        projects: list[Project] = []
-        for p in self.projects_dir.glob("*.json"):
-            if p.name.startswith("."):
-                continue
-            try:
-                with open(p) as f:
-                    projects.append(Project(**json.load(f)))
-            except (json.JSONDecodeError, TypeError, KeyError):
-                continue
-        return sorted(projects, key=lambda x: x.modified, reverse=True)
+        paths = [
+            p for p in self.projects_dir.glob("*.json")
+            if not p.name.startswith(".")
+        ]
+        if len(paths) > 1:
+            # Overlap the per-file reads; slow SD cards dominate startup.
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                loaded = list(pool.map(self._load_one, paths))
+        else:
+            loaded = [self._load_one(p) for p in paths]
+        projects = [p for p in loaded if p is not None]
+        # ISO-8601 strings sort chronologically as plain strings.
+        return sorted(projects, key=attrgetter("modified"), reverse=True)
 
     def save_project(self, project: Project) -> None:
         project.modified = datetime.now().isoformat()
-        with open(self.projects_dir / f"{project.id}.json", "w") as f:
-            json.dump(asdict(project), f, indent=2)
+        # Write beside the real file and swap it in, so a crash mid-save
+        # never leaves a truncated manuscript behind.
+        # Each write gets its own temp file, so an auto-save in the executor
+        # and a Ctrl+S on the loop thread can't trample each other.
+        path = self.projects_dir / f"{project.id}.json"
+        fd, tmp = tempfile.mkstemp(
+            dir=self.projects_dir, prefix=f".{project.id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(project.to_dict()))
+            os.chmod(tmp, 0o644)  # mkstemp's 0600 would stick after the swap
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
 
     def load_project(self, pid: str) -> Optional[Project]:
         path = self.projects_dir / f"{pid}.json"
         if path.exists():
-            with open(path) as f:
-                return Project(**json.load(f))
+            return Project(**_json_loads(path.read_bytes()))
         return None
 
     def delete_project(self, pid: str) -> None:
@@ -310,45 +426,62 @@ class Storage:
 _REFS_DIR = Path(__file__).resolve().parent / "refs"
 _SCREENSHOTS_DIR = Path(__file__).resolve().parent / "screenshots"
 _DEFAULT_SPACING = "double"
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+_QUOTES = frozenset("\"'")
 
 
 def parse_yaml_frontmatter(content: str) -> dict:
     """Extract key:value pairs from YAML frontmatter fenced by ---."""
-    m = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    m = _FRONTMATTER_RE.match(content)
     if not m:
         return {}
     yaml: dict[str, str] = {}
     for line in m.group(1).split("\n"):
-        idx = line.find(":")
-        if idx > 0:
-            key = line[:idx].strip()
-            val = line[idx + 1 :].strip()
-            # Strip surrounding quotes
-            if len(val) >= 2 and val[0] == val[-1] and val[0] in ('"', "'"):
-                val = val[1:-1]
-            yaml[key] = val
+        key, sep, val = line.partition(":")
+        if not sep or not key:
+            continue
+        key = key.strip()
+        val = val.strip()
+        # Strip surrounding quotes
+        if len(val) >= 2 and val[0] == val[-1] and val[0] in _QUOTES:
+            val = val[1:-1]
+        yaml[key] = val
     return yaml
 
 
 def resolve_reference_doc(yaml: dict) -> Optional[Path]:
     """Return path to the reference .docx for pandoc, or None."""
-    if not _REFS_DIR.is_dir():
+    try:
+        st = _REFS_DIR.stat()
+    except OSError:
+        return None
+    # One stat per export; the lookup below only reruns when the refs
+    # directory (or the requested spacing) changes.
+    return _find_reference_doc(_REFS_DIR, yaml.get("spacing") or "",
+                               st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _find_reference_doc(refs_dir: Path, spacing: str,
+                        _mtime_ns: int) -> Optional[Path]:
+    if not refs_dir.is_dir():
         return None
     # Explicit spacing: field
-    if yaml.get("spacing"):
-        p = _REFS_DIR / (yaml["spacing"] + ".docx")
+    if spacing:
+        p = refs_dir / (spacing + ".docx")
         if p.exists():
             return p
     # Default
-    p = _REFS_DIR / (_DEFAULT_SPACING + ".docx")
+    p = refs_dir / (_DEFAULT_SPACING + ".docx")
     if p.exists():
         return p
     # Any .docx
-    for p in sorted(_REFS_DIR.glob("*.docx")):
+    for p in sorted(refs_dir.glob("*.docx")):
         return p
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def detect_pandoc() -> Optional[str]:
     """Find the pandoc binary."""
     found = shutil.which("pandoc")
@@ -365,6 +498,7 @@ def detect_pandoc() -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def detect_libreoffice() -> Optional[str]:
     """Find the LibreOffice/soffice binary."""
     if sys.platform == "darwin":
@@ -385,22 +519,88 @@ def detect_libreoffice() -> Optional[str]:
     return shutil.which("libreoffice") or shutil.which("soffice")
 
 
-# ── Lua filter generators ─────────────────────────────────────────────
+async def _run_tool(args: list[str], timeout: float = 60,
+                    input: Optional[bytes] = None) -> int:
+    """Run pandoc/LibreOffice without blocking the event loop; return the exit code.
+
+    If ``input`` is given it is piped to the tool's stdin.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=(asyncio.subprocess.DEVNULL if input is None
+               else asyncio.subprocess.PIPE),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        await asyncio.wait_for(proc.communicate(input), timeout)
+        return proc.returncode
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+
+# LibreOffice conversions run on a private profile. After the first PDF
+# export a headless soffice is left running on it, so later --convert-to
+# calls hand their job to that instance over LibreOffice's own IPC pipe
+# instead of cold-starting the whole suite. Every conversion uses that
+# profile, never the user's default one; a conversion only counts as done
+# once the PDF has actually been written.
+_OFFICE_PROFILE = _CONFIG_DIR / "office-profile"
+_OFFICE_PIPE = "manuscripts-office"
+
+
+def _office_args(libreoffice: str, *args: str) -> list[str]:
+    return [libreoffice, f"-env:UserInstallation={_OFFICE_PROFILE.as_uri()}", *args]
+
+
+async def _office_convert(libreoffice: str, args, output: Path) -> bool:
+    """Run one --convert-to on the private profile; True if ``output`` was written."""
+    started = time.time()
+    if await _run_tool(_office_args(libreoffice, *args)) != 0:
+        return False
+    try:
+        return output.stat().st_mtime >= started - 1
+    except OSError:
+        return False
 
 
-def _lua_bib_entry_xml() -> str:
-    """Lua snippet: convert a Para block to a hanging-indent OpenXML raw block.
+def _start_office_daemon(libreoffice: str) -> subprocess.Popen:
+    """Leave a headless LibreOffice running for later conversions.
 
-    Walks each inline element so that Emph (italic) and Strong (bold)
-    formatting survive into the OpenXML output – fixing the bug where
-    ``pandoc.utils.stringify`` stripped all markup from bibliography entries.
+    On Linux ``soffice`` is the oosplash launcher and soffice.bin its child,
+    so the instance gets its own session and is stopped as a process group.
     """
-    return """
+    proc = _spawn(_office_args(
+        libreoffice, "--headless", "--invisible", "--nologo", "--norestore",
+        "--nodefault", f"--accept=pipe,name={_OFFICE_PIPE};urp;",
+    ), start_new_session=True)
+    atexit.register(_stop_office_daemon, proc)
+    return proc
+
+
+def _stop_office_daemon(proc: subprocess.Popen) -> None:
+    # Signal the whole group even if the launcher is gone: soffice.bin may
+    # have outlived it. The group id cannot be reused while it has members.
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except OSError:
+        pass
+
+
+# ── Lua filter generators ─────────────────────────────────────────────
+
+
+# Lua snippet: convert a Para block to a hanging-indent OpenXML raw block.
+# Walks each inline element so that Emph (italic) and Strong (bold)
+# formatting survive into the OpenXML output – fixing the bug where
+# ``pandoc.utils.stringify`` stripped all markup from bibliography entries.
+_LUA_BIB_ENTRY_XML = """
+local xml_entities = {["&"] = "&amp;", ["<"] = "&lt;", [">"] = "&gt;"}
+
 local function escape_xml(s)
-  s = s:gsub("&", "&amp;")
-  s = s:gsub("<", "&lt;")
-  s = s:gsub(">", "&gt;")
-  return s
+  return (s:gsub("[&<>]", xml_entities))
 end
 
 local function inlines_to_openxml(inlines)
@@ -456,9 +656,8 @@ end
 """
 
 
-def _lua_basic_filter() -> str:
-    """Page break before Bibliography heading + hanging indent for entries."""
-    return _lua_bib_entry_xml() + """
+# Page break before Bibliography heading + hanging indent for entries.
+_LUA_BASIC_FILTER = _LUA_BIB_ENTRY_XML + """
 function Pandoc(doc)
   local new_blocks = {}
   local in_bib = false
@@ -489,15 +688,25 @@ function Pandoc(doc)
 end"""
 
 
-def _lua_coverpage_filter(yaml: dict) -> str:
-    """Turabian-style cover page via OpenXML raw blocks."""
-    title = yaml.get("title", "").replace('"', '\\"')
-    author = yaml.get("author", "").replace('"', '\\"')
-    course = yaml.get("course", "").replace('"', '\\"')
-    instructor = yaml.get("instructor", "").replace('"', '\\"')
-    date = yaml.get("date", "").replace('"', '\\"')
+def _lua_basic_filter() -> str:
+    """Page break before Bibliography heading + hanging indent for entries."""
+    return _LUA_BASIC_FILTER
+
+
+_LUA_META_FIELDS = ("title", "author", "course", "instructor", "date")
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _lua_xml_literal(value: str) -> str:
+    """Escape a frontmatter value for a Lua "..." literal that lands in OpenXML.
 
-    return _lua_bib_entry_xml() + f"""-- Cover page format (Turabian style)
+    XML-escaped here once, so the filter can splice it into raw blocks as is.
+    """
+    return value.translate(_XML_ESCAPES).replace("\\", "\\\\").replace('"', '\\"')
+
+
+# Filled in with str.format by _lua_coverpage_filter; Lua braces are doubled.
+_LUA_COVERPAGE_TEMPLATE = """-- Cover page format (Turabian style)
 local meta_title = "{title}"
 local meta_author = "{author}"
 local meta_course = "{course}"
@@ -521,19 +730,19 @@ end
 
 function Meta(meta)
   if meta.title and meta_title == "" then
-    meta_title = pandoc.utils.stringify(meta.title)
+    meta_title = escape_xml(pandoc.utils.stringify(meta.title))
   end
   if meta.author and meta_author == "" then
-    meta_author = pandoc.utils.stringify(meta.author)
+    meta_author = escape_xml(pandoc.utils.stringify(meta.author))
   end
   if meta.course and meta_course == "" then
-    meta_course = pandoc.utils.stringify(meta.course)
+    meta_course = escape_xml(pandoc.utils.stringify(meta.course))
   end
   if meta.instructor and meta_instructor == "" then
-    meta_instructor = pandoc.utils.stringify(meta.instructor)
+    meta_instructor = escape_xml(pandoc.utils.stringify(meta.instructor))
   end
   if meta.date and meta_date == "" then
-    meta_date = pandoc.utils.stringify(meta.date)
+    meta_date = escape_xml(pandoc.utils.stringify(meta.date))
   end
   meta.author = nil
   meta.date = nil
@@ -683,15 +892,14 @@ function Pandoc(doc)
 end"""
 
 
-def _lua_header_filter(yaml: dict) -> str:
-    """MLA-style header block via OpenXML raw blocks."""
-    title = yaml.get("title", "").replace('"', '\\"')
-    author = yaml.get("author", "").replace('"', '\\"')
-    course = yaml.get("course", "").replace('"', '\\"')
-    instructor = yaml.get("instructor", "").replace('"', '\\"')
-    date = yaml.get("date", "").replace('"', '\\"')
+def _lua_coverpage_filter(yaml: dict) -> str:
+    """Turabian-style cover page via OpenXML raw blocks."""
+    fields = {k: _lua_xml_literal(yaml.get(k, "")) for k in _LUA_META_FIELDS}
+    return _LUA_BIB_ENTRY_XML + _LUA_COVERPAGE_TEMPLATE.format(**fields)
+
 
-    return _lua_bib_entry_xml() + f"""-- MLA Header format
+# Filled in with str.format by _lua_header_filter; Lua braces are doubled.
+_LUA_HEADER_TEMPLATE = """-- MLA Header format
 local meta_title = "{title}"
 local meta_author = "{author}"
 local meta_course = "{course}"
@@ -715,19 +923,19 @@ end
 
 function Meta(meta)
   if meta.title and meta_title == "" then
-    meta_title = pandoc.utils.stringify(meta.title)
+    meta_title = escape_xml(pandoc.utils.stringify(meta.title))
   end
   if meta.author and meta_author == "" then
-    meta_author = pandoc.utils.stringify(meta.author)
+    meta_author = escape_xml(pandoc.utils.stringify(meta.author))
   end
   if meta.course and meta_course == "" then
-    meta_course = pandoc.utils.stringify(meta.course)
+    meta_course = escape_xml(pandoc.utils.stringify(meta.course))
   end
   if meta.instructor and meta_instructor == "" then
-    meta_instructor = pandoc.utils.stringify(meta.instructor)
+    meta_instructor = escape_xml(pandoc.utils.stringify(meta.instructor))
   end
   if meta.date and meta_date == "" then
-    meta_date = pandoc.utils.stringify(meta.date)
+    meta_date = escape_xml(pandoc.utils.stringify(meta.date))
   end
   meta.author = nil
   meta.date = nil
@@ -831,6 +1039,12 @@ function Pandoc(doc)
 end"""
 
 
+def _lua_header_filter(yaml: dict) -> str:
+    """MLA-style header block via OpenXML raw blocks."""
+    fields = {k: _lua_xml_literal(yaml.get(k, "")) for k in _LUA_META_FIELDS}
+    return _LUA_BIB_ENTRY_XML + _LUA_HEADER_TEMPLATE.format(**fields)
+
+
 def _generate_lua_filter(yaml: dict) -> str:
     """Dispatch to the right Lua filter based on style: field."""
     fmt = yaml.get("style", "")
@@ -862,6 +1076,15 @@ _EMPTY_FOOTER_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 </w:ftr>"""
 
 
+def _is_docx_part(name: str, prefix: str) -> bool:
+    """True for "<prefix>.xml" or "<prefix>N.xml", e.g. word/header2.xml."""
+    return (
+        name.startswith(prefix)
+        and name.endswith(".xml")
+        and (len(name) == len(prefix) + 4 or name[len(prefix):-4].isdigit())
+    )
+
+
 def _postprocess_docx(docx_path: str, yaml: dict) -> None:
     """Strip headers/footers and replace {{LASTNAME}} in DOCX zip."""
     fmt = yaml.get("style", "")
@@ -872,34 +1095,44 @@ def _postprocess_docx(docx_path: str, yaml: dict) -> None:
     author = yaml.get("author", "")
     lastname = yaml.get("lastname", "")
     if not lastname and author:
-        lastname = author.split()[-1] if author.split() else ""
-
-    buf = io.BytesIO()
-    with zipfile.ZipFile(docx_path, "r") as zin:
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zout:
-            for item in zin.infolist():
-                data = zin.read(item.filename)
-                is_header = re.match(r"word/header\d*\.xml", item.filename)
-                is_footer = re.match(r"word/footer\d*\.xml", item.filename)
-
-                if strip_headers and is_header:
-                    data = _EMPTY_HEADER_XML
-                elif strip_footers and is_footer:
-                    data = _EMPTY_FOOTER_XML
-                elif is_header or is_footer:
-                    # Replace {{LASTNAME}} placeholder
-                    text = data.decode("utf-8")
-                    if lastname:
-                        text = text.replace("{{LASTNAME}} ", lastname + " ")
-                        text = text.replace("{{LASTNAME}}", lastname)
-                    else:
-                        text = text.replace("{{LASTNAME}} ", "")
-                        text = text.replace("{{LASTNAME}}", "")
-                    data = text.encode("utf-8")
-                zout.writestr(item, data)
+        lastname = _last_word(author)
 
-    with open(docx_path, "wb") as f:
-        f.write(buf.getvalue())
+    # Stream entry by entry into a sibling temp file, then swap it in, so
+    # the whole document is never held in memory.
+    tmp_path = docx_path + ".tmp"
+    try:
+        with zipfile.ZipFile(docx_path, "r") as zin:
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zout:
+                for item in zin.infolist():
+                    is_header = _is_docx_part(item.filename, "word/header")
+                    is_footer = _is_docx_part(item.filename, "word/footer")
+
+                    if strip_headers and is_header:
+                        data = _EMPTY_HEADER_XML
+                    elif strip_footers and is_footer:
+                        data = _EMPTY_FOOTER_XML
+                    elif is_header or is_footer:
+                        # Replace {{LASTNAME}} placeholder
+                        text = zin.read(item.filename).decode("utf-8")
+                        if lastname:
+                            text = text.replace("{{LASTNAME}} ", lastname + " ")
+                            text = text.replace("{{LASTNAME}}", lastname)
+                        else:
+                            text = text.replace("{{LASTNAME}} ", "")
+                            text = text.replace("{{LASTNAME}}", "")
+                        data = text.encode("utf-8")
+                    else:
+                        with zin.open(item) as src, zout.open(item, "w") as dst:
+                            shutil.copyfileobj(src, dst)
+                        continue
+                    zout.writestr(item, data)
+        os.replace(tmp_path, docx_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -907,38 +1140,65 @@ def _postprocess_docx(docx_path: str, yaml: dict) -> None:
 # ════════════════════════════════════════════════════════════════════════
 
 
-def fuzzy_filter(sources: list[Source], query: str) -> list[Source]:
-    if not query:
+def _fuzzy_rank(q: str, hays: list[str], cutoff: float) -> list[int]:
+    """Indexes of hays that match q, best first; substring hits score 100."""
+    if _rf_process is not None:
+        # fuzz.ratio is 2 * matches / total length, like SequenceMatcher's
+        # ratio, so the cutoffs mean the same with or without rapidfuzz
+        # (WRatio's partial/token scoring passes nearly everything).  Haystacks
+        # arrive already lower-cased (Source._haystack); skip rapidfuzz's
+        # own per-string preprocessing.
+        hits = _rf_process.extract(
+            q, hays, scorer=_rf_fuzz.ratio, processor=None,
+            score_cutoff=cutoff, limit=None,
+        )
+        ratios = {i: score for _, score, i in hits}
+        scored = []
+        for i, hay in enumerate(hays):
+            if q in hay:
+                scored.append((100.0, i))
+            elif ratios.get(i, 0) > cutoff:
+                scored.append((ratios[i], i))
+    else:
+        # Same argument order as SequenceMatcher(None, q, hay): ratio() is
+        # not symmetric.  The query side is set once; only hay changes.
+        matcher = SequenceMatcher(None)
+        matcher.set_seq1(q)
+        scored = []
+        for i, hay in enumerate(hays):
+            if q in hay:
+                scored.append((100.0, i))
+            else:
+                matcher.set_seq2(hay)
+                ratio = matcher.ratio() * 100
+                if ratio > cutoff:
+                    scored.append((ratio, i))
+    scored.sort(key=lambda x: (-x[0], x[1]))
+    return [i for _, i in scored]
+
+
+def fuzzy_filter(sources: list[Source], query: str,
+                 hays: Optional[list[str]] = None) -> list[Source]:
+    """Rank sources against query, best first.
+
+    Callers that filter the same list on every keystroke (CitePickerDialog)
+    pass ``hays``, the sources' ``_haystack`` strings built once up front.
+    """
+    # Every haystack contains a space, so a blank query would score every
+    # source 100 and keep the original order; skip the scorer entirely.
+    if not query or query.isspace():
         return list(sources)
-    q = query.lower()
-    scored: list[tuple[float, Source]] = []
-    for s in sources:
-        hay = f"{s.author} {s.title} {s.year}".lower()
-        if q in hay:
-            scored.append((100.0, s))
-        else:
-            ratio = SequenceMatcher(None, q, hay).ratio() * 100
-            if ratio > 30:
-                scored.append((ratio, s))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [s for _, s in scored]
+    if hays is None:
+        hays = [s._haystack for s in sources]
+    ranked = _fuzzy_rank(query.lower(), hays, 30)
+    return [sources[i] for i in ranked]
 
 
 def fuzzy_filter_projects(projects: list[Project], query: str) -> list[Project]:
     if not query:
         return list(projects)
-    q = query.lower()
-    scored: list[tuple[float, Project]] = []
-    for p in projects:
-        hay = p.name.lower()
-        if q in hay:
-            scored.append((100.0, p))
-        else:
-            ratio = SequenceMatcher(None, q, hay).ratio() * 100
-            if ratio > 70:
-                scored.append((ratio, p))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [p for _, p in scored]
+    ranked = _fuzzy_rank(query.lower(), [p.name.lower() for p in projects], 70)
+    return [projects[i] for i in ranked]
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -983,43 +1243,103 @@ SOURCE_FIELDS: dict[str, list[tuple[str, str]]] = {
 }
 
 
+_BIB_TYPE_MAP = {
+    "book": "book",
+    "inbook": "book_section",
+    "incollection": "book_section",
+    "article": "article",
+    "inproceedings": "article",
+    "conference": "article",
+    "misc": "website",
+    "online": "website",
+    "electronic": "website",
+}
+_BIB_ENTRY_START_RE = re.compile(r"@(\w+)\s*\{")
+_BIB_FIELD_NAME_RE = re.compile(r"[\s,]*(\w[\w-]*)\s*=\s*")
+_BIB_DELIM_RE = re.compile(r'[{}"]')
+
+
+def _bib_close(text: str, pos: int, quoted: bool = False) -> int:
+    """Index of the brace (or quote) closing a value that starts at pos.
+
+    Scans brace to brace in one forward pass, so nesting like
+    ``{The {DNA} Story}`` is handled without regex backtracking.
+    Returns len(text) if the value is unterminated.
+    """
+    # Common case: no nested braces before the closer.
+    close = text.find('"' if quoted else "}", pos)
+    if close != -1 and text.find("{", pos, close) == -1 and (
+            not quoted or text.find("}", pos, close) == -1):
+        return close
+    depth = 0
+    for m in _BIB_DELIM_RE.finditer(text, pos):
+        c = m.group()
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            if depth == 0:
+                return m.start()
+            depth -= 1
+        elif quoted and depth == 0:
+            return m.start()
+    return len(text)
+
+
+def _bib_fields(body: str) -> dict[str, str]:
+    """Parse the ``name = value, ...`` list of one entry (after its key)."""
+    fields: dict[str, str] = {}
+    pos = 0
+    while True:
+        m = _BIB_FIELD_NAME_RE.match(body, pos)
+        if not m:
+            return fields
+        pos = m.end()
+        opener = body[pos:pos + 1]
+        if opener in ("{", '"'):
+            end = _bib_close(body, pos + 1, quoted=opener == '"')
+            value = body[pos + 1:end]
+            pos = end + 1
+        else:
+            # Bare value such as a year: runs to the next comma.
+            end = body.find(",", pos)
+            if end == -1:
+                end = len(body)
+            value = body[pos:end]
+            pos = end
+        # Inner braces only protect capitalisation; drop them for display.
+        fields[m.group(1).lower()] = value.replace("{", "").replace("}", "").strip()
+
+
 def parse_bibtex(text: str) -> list[Source]:
     """Parse BibTeX entries into Source objects.
 
     Handles @book{...}, @article{...}, @misc{...}, @online{...}, etc.
     """
     sources: list[Source] = []
-    # Match @type{key, ... } entries (greedy within braces, balanced)
-    entry_re = re.compile(r"@(\w+)\s*\{([^,]*),\s*(.*?)\}\s*(?=@|\Z)", re.DOTALL)
-    field_re = re.compile(r"(\w+)\s*=\s*[{\"](.*?)[}\"]", re.DOTALL)
-
-    type_map = {
-        "book": "book",
-        "inbook": "book_section",
-        "incollection": "book_section",
-        "article": "article",
-        "inproceedings": "article",
-        "conference": "article",
-        "misc": "website",
-        "online": "website",
-        "electronic": "website",
-    }
-
-    for m in entry_re.finditer(text):
+    # One timestamp for the batch; the running index keeps ids unique.
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    pos = 0
+    while True:
+        m = _BIB_ENTRY_START_RE.search(text, pos)
+        if not m:
+            break
+        end = _bib_close(text, m.end())
+        pos = end + 1
         bib_type = m.group(1).lower()
-        body = m.group(3)
-        fields: dict[str, str] = {}
-        for fm in field_re.finditer(body):
-            fields[fm.group(1).lower()] = fm.group(2).strip()
+        body = text[m.end():end]
+        comma = body.find(",")
+        if comma == -1:
+            continue  # no fields (or @string/@preamble without a key)
+        fields = _bib_fields(body[comma + 1:])
 
-        stype = type_map.get(bib_type, "book")
+        stype = _BIB_TYPE_MAP.get(bib_type, "book")
         author = fields.get("author", "")
         title = fields.get("title", "")
         if not author and not title:
             continue
 
         sources.append(Source(
-            id=datetime.now().strftime("%Y%m%d_%H%M%S_%f") + f"_{len(sources)}",
+            id=f"{stamp}_{len(sources)}",
             source_type=stype,
             author=author,
             title=title,
@@ -1056,6 +1376,38 @@ class MarkdownLexer(PtLexer):
         (re.compile(r'\[[^\]]+\]\([^)]+\)'), 'class:md.link'),
     ]
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _lex_line(text):
+        # Cached by line text: each keystroke creates a new Document, but
+        # every visible line except the edited one is unchanged.
+        if text.startswith('#'):
+            hm = MarkdownLexer._HEADING_RE.match(text)
+            if hm:
+                return [
+                    ('class:md.heading-marker', hm.group(1)),
+                    ('class:md.heading', hm.group(2)),
+                ]
+        matches = []
+        for pattern, style in MarkdownLexer._PATTERNS:
+            for m in pattern.finditer(text):
+                matches.append((m.start(), m.end(), style))
+        if not matches:
+            return [('', text)]
+        matches.sort(key=lambda x: x[0])
+        fragments = []
+        pos = 0
+        for start, end, style in matches:
+            if start < pos:
+                continue
+            if start > pos:
+                fragments.append(('', text[pos:start]))
+            fragments.append((style, text[start:end]))
+            pos = end
+        if pos < len(text):
+            fragments.append(('', text[pos:]))
+        return fragments
+
     def lex_document(self, document):
         lines = document.lines
 
@@ -1066,31 +1418,7 @@ class MarkdownLexer(PtLexer):
                 return []
             if not text:
                 return [('', '')]
-            hm = MarkdownLexer._HEADING_RE.match(text)
-            if hm:
-                return [
-                    ('class:md.heading-marker', hm.group(1)),
-                    ('class:md.heading', hm.group(2)),
-                ]
-            matches = []
-            for pattern, style in MarkdownLexer._PATTERNS:
-                for m in pattern.finditer(text):
-                    matches.append((m.start(), m.end(), style))
-            if not matches:
-                return [('', text)]
-            matches.sort(key=lambda x: x[0])
-            fragments = []
-            pos = 0
-            for start, end, style in matches:
-                if start < pos:
-                    continue
-                if start > pos:
-                    fragments.append(('', text[pos:start]))
-                fragments.append((style, text[start:end]))
-                pos = end
-            if pos < len(text):
-                fragments.append(('', text[pos:]))
-            return fragments
+            return MarkdownLexer._lex_line(text)
 
         return get_line
 
@@ -1268,6 +1596,9 @@ class SelectableList:
         self.items = []
         self.selected_index = 0
         self.on_select = on_select
+        self._rendered = None  # (selected_index, cols, fragments)
+        self._rows = {}  # label -> rendered line, for the current width
+        self._rows_cols = None
         self._kb = KeyBindings()
         sl = self
 
@@ -1309,21 +1640,40 @@ class SelectableList:
             cols = get_app().output.get_size().columns
         except Exception:
             cols = 80
+        cached = self._rendered
+        if cached and cached[0] == self.selected_index and cached[1] == cols:
+            return cached[2]
+        # Lay out only rows that weren't on screen last time; when a filter
+        # narrows the list, the surviving rows are reused as-is.
+        prev = self._rows if cols == self._rows_cols else {}
+        rows = {}
         result = []
         for i, (_, label) in enumerate(self.items):
-            if "\t" in label:
-                left, right = label.split("\t", 1)
-                padding = max(1, cols - len(left) - len(right) - 3)
-                label = left + " " * padding + right + " "
+            line = rows.get(label) or prev.get(label)
+            if line is None:
+                text = label
+                if "\t" in text:
+                    left, right = text.split("\t", 1)
+                    padding = max(1, cols - len(left) - len(right) - 3)
+                    text = left + " " * padding + right + " "
+                line = f"  {text}\n"
+            rows[label] = line
             if i == self.selected_index:
                 result.append(("[SetCursorPosition]", ""))
-                result.append(("class:select-list.selected", f"  {label}\n"))
+                result.append(("class:select-list.selected", line))
             else:
-                result.append(("", f"  {label}\n"))
+                result.append(("", line))
+        self._rows, self._rows_cols = rows, cols
+        self._rendered = (self.selected_index, cols, result)
         return result
 
     def set_items(self, items):
+        # Typing often leaves the visible rows unchanged; keep the rendered
+        # fragments rather than rebuilding them on every keystroke.
+        if items == self.items:
+            return
         self.items = items
+        self._rendered = None
         if self.selected_index >= len(items):
             self.selected_index = max(0, len(items) - 1)
 
@@ -1346,6 +1696,8 @@ class AppState:
         self.screen = "projects"
         self.notification = ""
         self.notification_task = None
+        self.project_search_task = None
+        self.exports_cache = None  # (dir st_mtime_ns, [(Path, mtime), ...])
         self.quit_pending = 0.0
         self.quit_pending2 = 0.0
         self.escape_pending = 0.0
@@ -1357,6 +1709,11 @@ class AppState:
         self.auto_save_task = None
         self.export_paths = []
         self.show_word_count = 2  # 0=words, 1=paragraphs, 2=off
+        self.counted_text = ""  # editor text the status-bar count reflects
+        self.count_task = None
+        self.office_proc = None  # headless LibreOffice kept for PDF exports
+        self.office_users = 0  # PDF conversions running on the office profile
+        self.export_locks = {}  # lower-cased export stem -> asyncio.Lock
         self.last_find_query = ""
         self.show_find_panel = False
         self.find_panel = None
@@ -1447,21 +1804,51 @@ async def _discover_teachers(timeout: float = 3.0) -> list:
     return found
 
 
-def _detect_printers():
-    """Return list of available printer names via lpstat."""
+def _spawn(args, **kwargs):
+    """Start a helper program (viewer, lp, screenshot tool) without waiting.
+
+    Passing an absolute executable path with close_fds=False lets subprocess
+    use posix_spawn/vfork instead of fork()ing the whole UI process; our own
+    fds are non-inheritable anyway. Extra keyword arguments go to Popen.
+    Raises FileNotFoundError if the program is not installed.
+    """
+    exe = shutil.which(args[0])
+    if exe is None:
+        raise FileNotFoundError(args[0])
+    return subprocess.Popen(
+        [exe, *args[1:]], close_fds=False, stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **kwargs,
+    )
+
+
+_printers = ()  # last non-empty lpstat listing
+
+
+def _detect_printers(refresh=False):
+    """Return available printer names via lpstat.
+
+    A non-empty listing is kept for the session (^r in exports refreshes it);
+    an empty or failed one is not, so a printer CUPS brings up after launch
+    still shows up on the next print.
+    """
+    global _printers
+    if _printers and not refresh:
+        return _printers
     try:
         result = subprocess.run(
             ["lpstat", "-a"], capture_output=True, text=True, timeout=5,
         )
         if result.returncode != 0 or not result.stdout.strip():
-            return []
-        return [
-            line.split()[0]
-            for line in result.stdout.strip().splitlines()
-            if line.split()
-        ]
+            _printers = ()
+        else:
+            _printers = tuple(
+                line.split()[0]
+                for line in result.stdout.strip().splitlines()
+                if line.split()
+            )
     except Exception:
-        return []
+        _printers = ()
+    return _printers
 
 
 _clip_copy_cmd = None
@@ -1516,25 +1903,48 @@ def _clipboard_paste():
     return None
 
 
+def _last_word(text: str) -> str:
+    """Last whitespace-separated word of ``text`` ("" if there is none)."""
+    parts = text.rsplit(None, 1)
+    return parts[-1] if parts else ""
+
+
+@functools.lru_cache(maxsize=4096)
+def _display_date(iso: str) -> str:
+    """"March 7, 2025" for an ISO timestamp, or "" if it does not parse."""
+    try:
+        return datetime.fromisoformat(iso).strftime("%B %-d, %Y")
+    except (ValueError, TypeError):
+        return ""
+
+
+_FRONTMATTER_BLOCK_RE = re.compile(r"^---\n.*?\n---\n?", re.DOTALL)
+_PARA_BREAK_RE = re.compile(r"\n\s*\n")
+_BIB_HEADING_RE = re.compile(
+    r"^## (?:Bibliography|References|Works Cited)\s*$", re.MULTILINE,
+)
+
+
+# The status bar asks for these on every redraw (cursor moves, notifications);
+# caching the last document keeps that O(1) until the text actually changes.
+@functools.lru_cache(maxsize=1)
 def _para_count(text):
     """Count paragraphs in text (excluding YAML frontmatter)."""
-    body = re.sub(r"^---\n.*?\n---\n?", "", text, count=1, flags=re.DOTALL)
-    return sum(1 for p in re.split(r"\n\s*\n", body) if p.strip())
+    body = _FRONTMATTER_BLOCK_RE.sub("", text, count=1)
+    return sum(1 for p in _PARA_BREAK_RE.split(body) if p.strip())
 
 
+@functools.lru_cache(maxsize=1)
 def _word_count(text):
     """Count words in text (excluding YAML frontmatter)."""
-    body = re.sub(r"^---\n.*?\n---\n?", "", text, count=1, flags=re.DOTALL)
+    body = _FRONTMATTER_BLOCK_RE.sub("", text, count=1)
     return len(body.split())
 
 
 def _strip_for_combine(text):
     """Strip YAML frontmatter and bibliography section for combining."""
-    body = re.sub(r"^---\n.*?\n---\n?", "", text, count=1, flags=re.DOTALL)
-    body = re.split(
-        r"^## (?:Bibliography|References|Works Cited)\s*$",
-        body, maxsplit=1, flags=re.MULTILINE,
-    )[0]
+    body = _FRONTMATTER_BLOCK_RE.sub("", text, count=1)
+    body = _BIB_HEADING_RE.split(body, maxsplit=1)[0]
     return body.strip()
 
 
@@ -1722,10 +2132,10 @@ class PrinterPickerDialog:
 
     def _select(self, printer):
         try:
-            subprocess.Popen([
+            _spawn([
                 "lp", "-d", printer, "-o", "sides=two-sided-long-edge",
                 str(self.file_path),
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            ])
         except Exception:
             pass
         if not self.future.done():
@@ -1831,6 +2241,9 @@ class TeacherPickerDialog:
         return self.dialog
 
 
+_CITE_SEARCH_DEBOUNCE = 0.08  # seconds of typing pause before re-filtering
+
+
 class CitePickerDialog:
     """Fuzzy-search sources and pick one to insert as a footnote."""
 
@@ -1838,6 +2251,14 @@ class CitePickerDialog:
         self.future = asyncio.Future()
         self.all_sources = sources
         self.filtered = list(sources)
+        self._search_task = None
+        self._by_id = {s.id: s for s in sources}
+        self._hays = [s._haystack for s in sources]
+        self._labels = {
+            s.id: (f"{s.author} ({s.year}) \u2014 {s.title}" if s.author
+                   else s.title)
+            for s in sources
+        }
         self.search_buf = Buffer(multiline=False)
         self.search_buf.on_text_changed += self._on_search_changed
         search_kb = KeyBindings()
@@ -1848,10 +2269,12 @@ class CitePickerDialog:
 
         @search_kb.add("down")
         def _down(event):
+            self._flush_search()
             event.app.layout.focus(self.results.window)
 
         @search_kb.add("enter")
         def _enter(event):
+            self._flush_search()
             if self.filtered:
                 idx = min(self.results.selected_index, len(self.filtered) - 1)
                 s = self.filtered[idx]
@@ -1879,23 +2302,35 @@ class CitePickerDialog:
         )
 
     def _on_search_changed(self, buf):
-        self._update_results(buf.text)
+        # Coalesce a burst of keystrokes into one re-filter once typing pauses.
+        if self._search_task:
+            self._search_task.cancel()
+
+        async def _update_later():
+            await asyncio.sleep(_CITE_SEARCH_DEBOUNCE)
+            self._search_task = None
+            self._update_results(buf.text)
+            get_app().invalidate()
+
+        self._search_task = asyncio.ensure_future(_update_later())
+
+    def _flush_search(self):
+        """Apply a pending query now (e.g. Enter pressed mid-debounce)."""
+        if self._search_task:
+            self._search_task.cancel()
+            self._search_task = None
+            self._update_results(self.search_buf.text)
 
     def _update_results(self, query):
-        self.filtered = fuzzy_filter(self.all_sources, query)
-        items = [(s.id,
-                  f"{s.author} ({s.year}) \u2014 {s.title}" if s.author
-                  else s.title)
-                 for s in self.filtered]
-        self.results.set_items(items)
+        self.filtered = fuzzy_filter(self.all_sources, query, self._hays)
+        labels = self._labels
+        self.results.set_items([(s.id, labels[s.id]) for s in self.filtered])
         self.results.selected_index = 0
 
     def _on_select(self, source_id):
-        for s in self.filtered:
-            if s.id == source_id:
-                if not self.future.done():
-                    self.future.set_result(s.to_chicago_footnote())
-                return
+        s = self._by_id.get(source_id)
+        if s is not None and not self.future.done():
+            self.future.set_result(s.to_chicago_footnote())
 
     def cancel(self):
         if not self.future.done():
@@ -2106,10 +2541,11 @@ class SourcesDialog:
                 if sources:
                     existing = self.project.get_sources()
                     existing_keys = {(s.author, s.title, s.year) for s in existing}
+                    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
                     added = 0
                     for s in sources:
                         if (s.author, s.title, s.year) not in existing_keys:
-                            s.id = datetime.now().strftime("%Y%m%d_%H%M%S_%f") + f"_{added}"
+                            s.id = f"{stamp}_{added}"
                             self.project.add_source(s)
                             existing_keys.add((s.author, s.title, s.year))
                             added += 1
@@ -2264,9 +2700,11 @@ class ImportSourcesDialog:
     def __init__(self, projects):
         self.future = asyncio.Future()
         self._projects = projects
+        self._projects_by_id = {p.id: p for p in projects}
         self._phase = "projects"
         self._selected_project = None
         self._sources = []
+        self._sources_by_id = {}
         self.list = SelectableList(on_select=self._on_select)
         self._show_projects()
 
@@ -2303,6 +2741,7 @@ class ImportSourcesDialog:
     def _show_projects(self):
         self._phase = "projects"
         self._sources = []
+        self._sources_by_id = {}
         self.list.set_items([
             (p.id, f"{p.name}  ({len(p.get_sources())} sources)")
             for p in self._projects
@@ -2313,6 +2752,7 @@ class ImportSourcesDialog:
         self._phase = "sources"
         self._selected_project = project
         self._sources = project.get_sources()
+        self._sources_by_id = {s.id: s for s in self._sources}
         if not self._sources:
             self.list.set_items([("__empty__", "No sources in this manuscript.")])
         else:
@@ -2328,16 +2768,13 @@ class ImportSourcesDialog:
         if item_id == "__empty__":
             return
         if self._phase == "projects":
-            for p in self._projects:
-                if p.id == item_id:
-                    self._show_sources(p)
-                    return
+            p = self._projects_by_id.get(item_id)
+            if p is not None:
+                self._show_sources(p)
         elif self._phase == "sources":
-            for s in self._sources:
-                if s.id == item_id:
-                    if not self.future.done():
-                        self.future.set_result([s])
-                    return
+            s = self._sources_by_id.get(item_id)
+            if s is not None and not self.future.done():
+                self.future.set_result([s])
 
     def _go_back(self):
         if self._phase == "sources":
@@ -2978,7 +3415,16 @@ class FindReplacePanel:
 # ════════════════════════════════════════════════════════════════════════
 
 
-_FRONTMATTER_PROPS = ["title", "author", "instructor", "date", "spacing", "style"]
+_EXPORT_SUFFIXES = (".pdf", ".docx", ".md")
+_SEARCH_DEBOUNCE = 0.12  # seconds of typing pause before the project list refilters
+_STATUS_DEBOUNCE = 0.1  # seconds of typing pause before the word count updates
+_FRONTMATTER_PROPS = ("title", "author", "instructor", "date", "spacing", "style")
+_UNSAFE_NAME_RE = re.compile(r'[^\w\s-]')
+
+
+def _export_stem(name):
+    """File stem for exporting a manuscript called ``name``."""
+    return _UNSAFE_NAME_RE.sub('', name).strip().replace(' ', '_')[:50] or "export"
 
 
 def create_app(storage):
@@ -3013,8 +3459,9 @@ def create_app(storage):
 
     shutdown_hint_control = FormattedTextControl(_get_shutdown_hint)
 
-    def refresh_projects(query=""):
-        state.projects = state.storage.list_projects()
+    def refresh_projects(query="", reload=True):
+        if reload:
+            state.projects = state.storage.list_projects()
         filtered = fuzzy_filter_projects(state.projects, query)
         if not state.projects:
             project_list.set_items([
@@ -3026,37 +3473,62 @@ def create_app(storage):
             unpinned = [p for p in filtered if p.name not in state.pinned_projects]
             items = []
             for p in pinned + unpinned:
-                try:
-                    mod = datetime.fromisoformat(p.modified).strftime("%B %-d, %Y")
-                except (ValueError, TypeError):
-                    mod = ""
+                mod = _display_date(p.modified)
                 prefix = "* " if p.name in state.pinned_projects else "  "
                 items.append((p.id, f"{prefix}{p.name}\t{mod}"))
             project_list.set_items(items)
 
     def refresh_exports(query=""):
         export_dir = state.storage.exports_dir
-        files = []
-        for ext in ("*.pdf", "*.docx", "*.md"):
-            files.extend(export_dir.glob(ext))
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        # One directory pass and one stat per file, shared by the sort and
+        # the date column. The listing is reused until the directory itself
+        # changes (or an export overwrites a file; see run_export).
+        dir_mtime = os.stat(export_dir).st_mtime_ns
+        if state.exports_cache and state.exports_cache[0] == dir_mtime:
+            entries = state.exports_cache[1]
+        else:
+            entries = []
+            with os.scandir(export_dir) as it:
+                for e in it:
+                    if e.name.startswith(".") or not e.name.endswith(_EXPORT_SUFFIXES):
+                        continue
+                    try:
+                        if e.is_file():
+                            entries.append((Path(e.path), e.stat().st_mtime))
+                    except OSError:
+                        continue
+            entries.sort(key=lambda e: e[1], reverse=True)
+            state.exports_cache = (dir_mtime, entries)
         if query:
-            files = [f for f in files if query.lower() in f.name.lower()]
+            entries = [e for e in entries if query.lower() in e[0].name.lower()]
+        files = [f for f, _ in entries]
         state.export_paths = files
         if not files:
             export_list.set_items([("__empty__", "No exports yet.")])
         else:
             items = []
-            for f in files:
+            for f, mtime in entries:
                 try:
-                    mod = datetime.fromtimestamp(f.stat().st_mtime).strftime(
-                        "%B %-d, %Y")
+                    mod = datetime.fromtimestamp(mtime).strftime("%B %-d, %Y")
                 except (ValueError, OSError):
                     mod = ""
                 items.append((str(f), f"  {f.name}\t{mod}"))
             export_list.set_items(items)
 
-    project_search.buffer.on_text_changed += lambda buf: refresh_projects(buf.text)
+    def _on_project_search_changed(buf):
+        # Coalesce a burst of keystrokes into one refresh once typing pauses.
+        if state.project_search_task:
+            state.project_search_task.cancel()
+
+        async def _refresh_later():
+            await asyncio.sleep(_SEARCH_DEBOUNCE)
+            # Only the query changed; filter the projects already loaded.
+            refresh_projects(buf.text, reload=False)
+            get_app().invalidate()
+
+        state.project_search_task = asyncio.ensure_future(_refresh_later())
+
+    project_search.buffer.on_text_changed += _on_project_search_changed
     export_search.buffer.on_text_changed += lambda buf: refresh_exports(buf.text)
     refresh_projects()
     refresh_exports()
@@ -3068,6 +3540,7 @@ def create_app(storage):
         if project:
             state.current_project = project
             state.editor_dirty = False
+            state.counted_text = project.content
             # Place cursor below YAML front matter
             content = project.content
             cursor_pos = 0
@@ -3211,9 +3684,9 @@ def create_app(storage):
         def _open_in_os():
             try:
                 if sys.platform == "darwin":
-                    subprocess.Popen(["open", str(path)])
+                    _spawn(["open", str(path)])
                 else:
-                    subprocess.Popen(["xdg-open", str(path)])
+                    _spawn(["xdg-open", str(path)])
             except Exception:
                 pass
 
@@ -3260,7 +3733,8 @@ def create_app(storage):
     ])
 
     exports_hints_control = FormattedTextControl(
-        lambda: [("class:hint", " (/) search  ·  (d) delete  (p) print  (s) submit")])
+        lambda: [("class:hint",
+                  " (/) search  ·  (d) delete  (p) print  (s) submit  (^r) printers")])
     exports_hints_window = Window(content=exports_hints_control, height=1)
 
     exports_view = HSplit([
@@ -3307,7 +3781,23 @@ def create_app(storage):
         lexer=MarkdownLexer(),
         input_processors=[WordWrapProcessor(), ActiveHighlightProcessor(state)],
     )
-    editor_area.buffer.on_text_changed += lambda buf: setattr(state, 'editor_dirty', True)
+
+    def _on_editor_text_changed(buf):
+        state.editor_dirty = True
+        if state.show_word_count == 2:
+            return
+        # Recount once typing pauses rather than on every keystroke.
+        if state.count_task:
+            state.count_task.cancel()
+
+        async def _count_later():
+            await asyncio.sleep(_STATUS_DEBOUNCE)
+            state.counted_text = buf.text
+            get_app().invalidate()
+
+        state.count_task = asyncio.ensure_future(_count_later())
+
+    editor_area.buffer.on_text_changed += _on_editor_text_changed
 
     # ── Clipboard (Ctrl+C / Ctrl+V) on editor control ────────────
     _editor_cb_kb = KeyBindings()
@@ -3388,11 +3878,11 @@ def create_app(storage):
             return [("class:status", f" {state.notification}")]
         if state.current_project:
             if state.show_word_count == 0:
-                words = _word_count(editor_area.text)
+                words = _word_count(state.counted_text)
                 return [("class:status",
                          f" {state.current_project.name}  {words} words")]
             elif state.show_word_count == 1:
-                paras = _para_count(editor_area.text)
+                paras = _para_count(state.counted_text)
                 return [("class:status",
                          f" {state.current_project.name}  {paras} \u00b6")]
             else:
@@ -3483,15 +3973,31 @@ def create_app(storage):
         project = state.current_project
         if not project:
             return
+        # Exports to different files run side by side; one whose output
+        # stem is already being written (a repeat export, or another
+        # manuscript whose name sanitizes to the same stem) queues behind it.
+        async with _export_lock(_export_stem(project.name)):
+            await _export_project(project, export_format)
+
+    def _export_lock(stem):
+        # Lower-cased: the default macOS filesystem ignores case.
+        return state.export_locks.setdefault(stem.lower(), asyncio.Lock())
+
+    async def _export_project(project, export_format):
         export_dir = state.storage.exports_dir
-        safe_name = (re.sub(r'[^\w\s-]', '', project.name)
-                     .strip().replace(' ', '_')[:50] or "export")
+        safe_name = _export_stem(project.name)
         loop = asyncio.get_running_loop()
 
         if export_format == "md":
             out = export_dir / f"{safe_name}.md"
-            await loop.run_in_executor(
-                None, lambda: out.write_text(project.content))
+            tmp = export_dir / f".{safe_name}.md.tmp"
+
+            def _write():
+                tmp.write_bytes(project.content.encode("utf-8"))
+                os.replace(tmp, out)
+
+            await loop.run_in_executor(None, _write)
+            state.exports_cache = None
             show_notification(state, f"Exported: {out.name}")
             return
 
@@ -3514,18 +4020,18 @@ def create_app(storage):
             show_notification(state, "No reference .docx found in refs/ directory.")
             return
 
-        md_path = export_dir / f"{project.id}.md"
         lua_path = export_dir / f"{project.id}_filter.lua"
         docx_path = export_dir / f"{safe_name}.docx"
         pdf_path = export_dir / f"{safe_name}.pdf"
 
         try:
-            await loop.run_in_executor(None, lambda: md_path.write_text(project.content))
             lua_code = _generate_lua_filter(yaml)
             await loop.run_in_executor(None, lambda: lua_path.write_text(lua_code))
 
+            # The manuscript is piped to pandoc on stdin rather than written
+            # to a temporary .md file and read back.
             pandoc_args = [
-                pandoc, str(md_path), "--standalone",
+                pandoc, "-f", "markdown", "--standalone",
                 f"--reference-doc={ref_doc}", f"--lua-filter={lua_path}",
             ]
             if "bibliography" in yaml:
@@ -3534,10 +4040,8 @@ def create_app(storage):
 
             steps = "1/3" if export_format == "pdf" else "1/2"
             show_notification(state, f"Exporting\u2026 ({steps}) Running pandoc", duration=60)
-            result = await loop.run_in_executor(
-                None, lambda: subprocess.run(
-                    pandoc_args, capture_output=True, text=True, timeout=60))
-            if result.returncode != 0:
+            if await _run_tool(pandoc_args,
+                               input=project.content.encode("utf-8")) != 0:
                 show_notification(state, "Export failed: pandoc error")
                 return
 
@@ -3554,24 +4058,48 @@ def create_app(storage):
                 return
 
             show_notification(state, "Exporting\u2026 (3/3) Converting to PDF", duration=60)
-            lo_args = [
-                libreoffice, "--headless", "--convert-to", "pdf",
-                "--outdir", str(export_dir), str(docx_path),
-            ]
-            result = await loop.run_in_executor(
-                None, lambda: subprocess.run(
-                    lo_args, capture_output=True, text=True, timeout=60))
-            if result.returncode != 0:
+            office = state.office_proc
+            if office is not None and office.poll() is not None:
+                _stop_office_daemon(office)
+                office = state.office_proc = None
+            pdf_args = ("--headless", "--convert-to", "pdf",
+                        "--outdir", str(export_dir), str(docx_path))
+            state.office_users += 1
+            try:
+                ok = await _office_convert(libreoffice, pdf_args, pdf_path)
+                if (not ok and office is not None and state.office_users == 1
+                        and state.office_proc is office):
+                    # The resident instance may still be starting or be
+                    # wedged; nobody else is using it, so stop it and retry
+                    # once cold on the same private profile.
+                    _stop_office_daemon(office)
+                    state.office_proc = None
+                    try:
+                        await loop.run_in_executor(None, office.wait, 10)
+                    except subprocess.TimeoutExpired:
+                        pass
+                    ok = await _office_convert(libreoffice, pdf_args, pdf_path)
+            finally:
+                state.office_users -= 1
+            if not ok:
                 show_notification(state, "Export failed: LibreOffice error")
                 return
             show_notification(state, f"Exported: {pdf_path.name}")
+            # A cold conversion still running on the profile would take the
+            # new instance's arguments and let it exit; wait for it to finish.
+            if state.office_proc is None and state.office_users == 0:
+                try:
+                    state.office_proc = _start_office_daemon(libreoffice)
+                except OSError:
+                    state.office_proc = None
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             show_notification(state, "Export failed: timed out")
         except Exception as exc:
             show_notification(state, f"Export failed: {str(exc)[:80]}")
         finally:
-            cleanup = [md_path, lua_path]
+            state.exports_cache = None
+            cleanup = [lua_path]
             if export_format == "pdf":
                 cleanup.append(docx_path)
             for p in cleanup:
@@ -3584,6 +4112,11 @@ def create_app(storage):
     # ── Editor actions ───────────────────────────────────────────────
 
     def do_save(notify=True):
+        # Silent saves (leaving the editor, opening Sources) are skipped when
+        # nothing changed, like auto_save_loop, so they don't re-serialize
+        # and rewrite an unchanged manuscript.
+        if not notify and not state.editor_dirty:
+            return
         if state.current_project:
             state.current_project.content = editor_area.text
             state.storage.save_project(state.current_project)
@@ -3699,8 +4232,7 @@ def create_app(storage):
         if not sources:
             show_notification(state, "No sources. Add sources first.")
             return
-        sorted_sources = sorted(
-            sources, key=lambda s: s.author.split()[-1] if s.author else "")
+        sorted_sources = sorted(sources, key=lambda s: _last_word(s.author))
         lines = ["## Bibliography", ""]
         for s in sorted_sources:
             lines.append(s.to_chicago_bibliography())
@@ -3710,13 +4242,12 @@ def create_app(storage):
 
     def do_insert_frontmatter():
         text = editor_area.text
-        m = re.match(r"^---\n(.*?)\n---", text, re.DOTALL)
+        m = _FRONTMATTER_RE.match(text)
         if m:
-            existing = set()
-            for line in m.group(1).split("\n"):
-                idx = line.find(":")
-                if idx > 0:
-                    existing.add(line[:idx].strip())
+            existing = {
+                line[:idx].strip() for line in m.group(1).split("\n")
+                if (idx := line.find(":")) > 0
+            }
             missing = [p for p in _FRONTMATTER_PROPS if p not in existing]
             if not missing:
                 show_notification(state, "All frontmatter properties already present.")
@@ -3743,12 +4274,13 @@ def create_app(storage):
                     None, state.storage.load_project, project.id)
                 if not full or not full.content.strip():
                     continue
-                safe = (re.sub(r'[^\w\s-]', '', full.name)
-                        .strip().replace(' ', '_')[:50] or "export")
+                safe = _export_stem(full.name)
                 out = state.storage.exports_dir / f"{safe}.md"
-                await loop.run_in_executor(
-                    None, lambda p=out, c=full.content: p.write_text(c))
+                async with _export_lock(safe):
+                    await loop.run_in_executor(
+                        None, lambda p=out, c=full.content: p.write_text(c))
                 count += 1
+            state.exports_cache = None
             show_notification(
                 state, f"Exported {count} manuscript{'s' if count != 1 else ''} as Markdown.")
 
@@ -3910,6 +4442,7 @@ def create_app(storage):
                         path.unlink()
                     except OSError:
                         pass
+                    state.exports_cache = None
                     refresh_exports()
                     show_notification(state, "Export deleted.")
 
@@ -3972,6 +4505,20 @@ def create_app(storage):
 
         asyncio.ensure_future(_do_print())
 
+    @kb.add("c-r", filter=projects_list_focused)
+    def _(event):
+        # The printer list is cached for the session; this re-runs lpstat.
+        if not state.showing_exports:
+            return
+
+        async def _do():
+            loop = asyncio.get_running_loop()
+            printers = await loop.run_in_executor(None, _detect_printers, True)
+            n = len(printers)
+            show_notification(state, f"Found {n} printer{'s' if n != 1 else ''}.")
+
+        asyncio.ensure_future(_do())
+
     @kb.add("c", filter=projects_list_focused)
     def _(event):
         if state.showing_exports:
@@ -4150,6 +4697,7 @@ def create_app(storage):
     @kb.add("c-w", filter=is_editor & no_float)
     def _(event):
         state.show_word_count = (state.show_word_count + 1) % 3
+        state.counted_text = editor_area.text
         get_app().invalidate()
 
     @kb.add("c-k", filter=is_editor & no_float & find_panel_open)
@@ -4304,7 +4852,7 @@ def create_app(storage):
 
                 async def cmd_spell_check():
                     text = editor_area.buffer.text
-                    fm = re.match(r"^---\n.*?\n---\n?", text, re.DOTALL)
+                    fm = _FRONTMATTER_BLOCK_RE.match(text)
                     spell_text = (" " * fm.end() + text[fm.end():]) if fm else text
                     try:
                         proc = await asyncio.create_subprocess_exec(
@@ -4634,9 +5182,7 @@ def create_app(storage):
         else:
             cmd = ["scrot", str(out)]
         try:
-            subprocess.Popen(
-                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-            )
+            _spawn(cmd)
             show_notification(state, f"Screenshot: {out.name}")
         except FileNotFoundError:
             if sys.platform == "darwin":
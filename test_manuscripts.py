@@ -14,7 +14,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from manuscripts import (
-    Source, Project, Storage, fuzzy_filter,
+    Source, Project, Storage, fuzzy_filter, parse_bibtex,
     parse_yaml_frontmatter, resolve_reference_doc,
     detect_pandoc, detect_libreoffice,
     _generate_lua_filter, _lua_basic_filter,
@@ -160,6 +160,15 @@ def test_project_source_management():
     assert p.sources[0]["id"] == "s2"
     print("  Project source management OK")
 
+    # Malformed stored entries are skipped, not loaded with blank fields
+    p.sources.append({"id": "s3", "source_type": "book", "title": "No Author"})
+    p.sources.append({"source_type": "book", "author": "E", "title": "F",
+                      "year": "2002"})
+    p.sources.append({"id": "s4", "source_type": "book", "author": "G",
+                      "title": "H", "year": "2003", "colour": "red"})
+    assert [s.id for s in p.get_sources()] == ["s2"]
+    print("  Malformed sources skipped OK")
+
 
 def test_fuzzy_filter():
     sources = [
@@ -187,6 +196,48 @@ def test_fuzzy_filter():
 
     print("  Fuzzy filter OK")
 
+    # The cutoff must filter the same way whether or not rapidfuzz is
+    # installed; its partial-match scorers would pass every source here.
+    import manuscripts
+    more = sources + [
+        Source(id="4", source_type="book", author="Morrison, Toni",
+               title="Beloved", year="1987"),
+        Source(id="5", source_type="website", author="Doe, Jane",
+               title="Jazz Age Fashion", year="2019"),
+        Source(id="6", source_type="book_section", author="Bruccoli, Matthew",
+               title="Some Sort of Epic Grandeur", year="1981"),
+    ]
+    scorers = [manuscripts._rf_process, None]
+    try:
+        for manuscripts._rf_process in scorers:
+            assert [s.id for s in fuzzy_filter(more, "gatsby")] == ["1"]
+            assert [s.id for s in fuzzy_filter(more, "1925")] == ["1"]
+    finally:
+        manuscripts._rf_process = scorers[0]
+    if scorers[0] is None:
+        print("  Cutoff OK (rapidfuzz not installed, difflib only)")
+    else:
+        print("  Cutoff OK with rapidfuzz and difflib")
+
+    # Each picker opening gets a fresh list from get_sources(); an edit made
+    # in between must show up even if the new list reuses the old one's id.
+    project = Project(id="p", name="P", created="", modified="")
+    project.add_source(sources[0])
+    for i in range(50):
+        project.sources[0]["title"] = f"The Great Gatsby, draft {i}"
+        picker_sources = project.get_sources()
+        results = fuzzy_filter(picker_sources, "gatsby")
+        assert results and results[0].title == f"The Great Gatsby, draft {i}"
+        del picker_sources, results  # picker closes; its list is freed
+    titles = ["Moby-Dick", "Beloved", "Ulysses"]
+    for i in range(30):
+        project.sources[0]["title"] = titles[i % 3]
+        picker_sources = project.get_sources()
+        results = fuzzy_filter(picker_sources, titles[i % 3])
+        assert results and results[0].title == titles[i % 3]
+        del picker_sources, results
+    print("  Edited sources re-filtered OK")
+
 
 def test_parse_yaml_frontmatter():
     # Basic extraction
@@ -215,6 +266,38 @@ def test_parse_yaml_frontmatter():
     print("  Empty frontmatter OK")
 
 
+def test_parse_bibtex():
+    bib = """% exported from Zotero
+@book{darwin1859,
+  author = {Darwin, Charles},
+  title = {On the Origin of Species},
+  publisher = "John Murray",
+  year = 1859
+}
+% a comment between entries
+@article{watson1953,
+  author = {Watson, J. D. and Crick, F. H. C.},
+  title = {Molecular Structure of {DNA}},
+  journal = {Nature}, volume = {171}, pages = {737--738}, year = {1953}
+}
+@string{nat = "Nature"}
+"""
+    sources = parse_bibtex(bib)
+    assert len(sources) == 2
+    book, article = sources
+    assert book.source_type == "book"
+    assert book.author == "Darwin, Charles"
+    assert book.publisher == "John Murray"
+    assert book.year == "1859"
+    print("  Braced, quoted and bare values OK")
+
+    assert article.source_type == "article"
+    assert article.title == "Molecular Structure of DNA"
+    assert article.journal == "Nature"
+    assert article.pages == "737--738"
+    print("  Nested braces and comments between entries OK")
+
+
 def test_resolve_reference_doc():
     with tempfile.TemporaryDirectory() as tmpdir:
         import manuscripts
@@ -281,6 +364,14 @@ def test_lua_filter_generation():
     assert "MLA" in header
     print("  Header filter OK")
 
+    # Frontmatter values are XML-escaped, then quoted for a Lua string
+    tricky = {"title": 'Tom & Jerry <3 \\ "q"', "author": "Smith"}
+    literal = '"Tom &amp; Jerry &lt;3 \\\\ \\"q\\""'
+    assert f"local meta_title = {literal}" in _lua_coverpage_filter(tricky)
+    assert literal in _lua_header_filter(tricky)
+    assert 'Tom & Jerry' not in _lua_coverpage_filter(tricky)
+    print("  Escaped metadata OK")
+
     # Dispatcher
     assert _generate_lua_filter({"style": "chicago"}) == _lua_coverpage_filter({})
     assert _generate_lua_filter({"style": "mla"}) == _lua_header_filter({})
@@ -388,6 +479,10 @@ if __name__ == "__main__":
     test_parse_yaml_frontmatter()
     print("  ✓ YAML frontmatter tests passed\n")
 
+    print("Testing BibTeX parsing...")
+    test_parse_bibtex()
+    print("  ✓ BibTeX parsing tests passed\n")
+
     print("Testing reference doc resolution...")
     test_resolve_reference_doc()
     print("  ✓ Reference doc tests passed\n")